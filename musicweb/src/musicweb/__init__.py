@@ -14,8 +14,17 @@ __description__ = "Professional Music Library Management Suite"
 # Import main classes for easy access
 from .core.models import Track, Library
 from .core.comparison import LibraryComparator
+from .core.enrichment import EnrichmentManager
 from .platforms import create_parser
 from .platforms.detection import detect_platform
+from .integrations.playlist import PlaylistManager
+from .integrations.deduplication import YouTubeMusicDeduplicator
+
+# Optional cleaner integration (the module may be absent)
+try:
+    from .integrations.cleaner import YTMusicCleaner
+except ImportError:
+    YTMusicCleaner = None
 
 # Try to import optional utilities
 try:
@@ -39,6 +48,10 @@ __all__ = [
     "Track",
     "Library", 
     "LibraryComparator",
+    "EnrichmentManager",
+    "PlaylistManager",
+    "YouTubeMusicDeduplicator",
+    "YTMusicCleaner",
     "create_parser",
     "detect_platform",
     "get_logger",
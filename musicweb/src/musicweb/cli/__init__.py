@@ -5,6 +5,6 @@ This module provides CLI commands for music library management,
 comparison, and batch operations.
 """
 
-from .main import cli
+from .main import main as cli
 
 __all__ = ["cli"]
\ No newline at end of file
@@ -13,6 +13,7 @@ import argparse
 import json
 import sys
 import time
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -21,6 +22,51 @@ from musicweb import (
     EnrichmentManager, YouTubeMusicDeduplicator, YTMusicCleaner, create_parser, detect_platform
 )
 
+# Optional C-backed JSON for large plan/undo files
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+
+def _dump_json(data: Any, path: str) -> None:
+    """Write `data` as compact JSON, using orjson when available.
+
+    Plan/undo files are consumed by the rollback command, not edited by
+    hand, so skip indentation — it inflates both the bytes written and
+    the parse cost on reload.
+    """
+    if HAVE_ORJSON:
+        with open(path, 'wb', buffering=1 << 20) as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(path, 'w', buffering=1 << 20) as f:
+            json.dump(data, f, separators=(',', ':'))
+
+
+def _dump_json_pretty(data: Any, path) -> None:
+    """Write `data` as indented JSON for human-readable reports."""
+    if HAVE_ORJSON:
+        with open(path, 'wb', buffering=1 << 20) as f:
+            f.write(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            ))
+    else:
+        with open(path, 'w', buffering=1 << 20) as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+def _load_json(path: str) -> Any:
+    """Read a JSON file, using orjson when available."""
+    if HAVE_ORJSON:
+        with open(path, 'rb', buffering=1 << 20) as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', buffering=1 << 20) as f:
+        return json.load(f)
+
 
 class ProgressTracker:
     """Simple progress tracking for CLI operations."""
@@ -28,22 +74,41 @@ class ProgressTracker:
     def __init__(self, show_progress: bool = True):
         self.show_progress = show_progress
         self.last_progress = -1
-    
+        self._last_write = 0.0
+        self._tty = sys.stdout.isatty()
+
     def __call__(self, current: int, total: int, message: str = ""):
         if not self.show_progress:
             return
-        
+
         if total == 0:
             return
-        
+
         progress_percent = int((current / total) * 100)
-        
-        # Only update if progress changed significantly
-        if progress_percent != self.last_progress:
-            print(f"\r[{progress_percent:3d}%] {message}", end="", flush=True)
-            self.last_progress = progress_percent
-        
-        if current >= total:
+        done = current >= total
+
+        # Piped or CI output gets no benefit from \r rewrites; emit plain
+        # lines at 10% steps instead so logs stay readable.
+        if not self._tty:
+            if done or (progress_percent % 10 == 0
+                        and progress_percent != self.last_progress):
+                print(f"[{progress_percent:3d}%] {message}")
+                self.last_progress = progress_percent
+            return
+
+        # Throttle writes: only on an integer-percent change, and at most
+        # ~20 updates/second, so per-item callbacks don't cost a syscall
+        # each. Completion always writes so the final state is shown.
+        now = time.monotonic()
+        if not done and (progress_percent == self.last_progress
+                         or now - self._last_write < 0.05):
+            return
+
+        print(f"\r[{progress_percent:3d}%] {message}", end="", flush=True)
+        self.last_progress = progress_percent
+        self._last_write = now
+
+        if done:
             print()  # New line when complete
 
 
@@ -116,6 +181,32 @@ def compare_command(args):
     return result
 
 
+def _tracks_from_csv(path: str) -> List[Track]:
+    """Load Track objects from a missing-tracks CSV.
+
+    csv.DictReader streams rows directly — no DataFrame construction, no
+    per-row boxed Series the way df.iterrows() produces them. Missing
+    columns become empty/None and blank or unparsable durations become
+    None, matching the old pandas NaN handling.
+    """
+    import csv
+    tracks = []
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            duration = row.get('duration')
+            try:
+                duration = int(float(duration)) if duration else None
+            except (TypeError, ValueError):
+                duration = None
+            tracks.append(Track(
+                title=row.get('title') or '',
+                artist=row.get('artist') or '',
+                album=row.get('album') or None,
+                duration=duration
+            ))
+    return tracks
+
+
 def create_playlist_command(args):
     """Handle playlist creation command."""
     print("🎵 YouTube Music Playlist Creation")
@@ -133,18 +224,7 @@ def create_playlist_command(args):
     # Determine how to load tracks
     if args.tracks.endswith('.csv'):
         # Load from CSV (missing tracks file)
-        import pandas as pd
-        df = pd.read_csv(args.tracks)
-        
-        tracks = []
-        for _, row in df.iterrows():
-            track = Track(
-                title=str(row.get('title', '')),
-                artist=str(row.get('artist', '')),
-                album=str(row.get('album', '')) or None,
-                duration=row.get('duration') if pd.notna(row.get('duration')) else None
-            )
-            tracks.append(track)
+        tracks = _tracks_from_csv(args.tracks)
     else:
         # Load as library file
         library = load_library(args.tracks)
@@ -202,8 +282,7 @@ def create_playlist_command(args):
             
             if args.save_failed:
                 failed_file = Path(args.output_dir or '.') / f"failed_tracks_{int(time.time())}.json"
-                with open(failed_file, 'w') as f:
-                    json.dump(result['failed_tracks'], f, indent=2)
+                _dump_json_pretty(result['failed_tracks'], failed_file)
                 print(f"  Failed tracks saved to: {failed_file}")
     else:
         print(f"\n❌ Playlist creation failed: {result['error']}")
@@ -263,8 +342,7 @@ def analyze_command(args):
         output_path.mkdir(parents=True, exist_ok=True)
         
         analysis_file = output_path / f"multi_library_analysis_{int(time.time())}.json"
-        with open(analysis_file, 'w') as f:
-            json.dump(analysis, f, indent=2, default=str)
+        _dump_json_pretty(analysis, analysis_file)
         
         print(f"\n💾 Analysis saved to: {analysis_file}")
     
@@ -307,19 +385,22 @@ def enrich_command(args):
         output_path.mkdir(parents=True, exist_ok=True)
         
         enriched_file = output_path / f"enriched_library_{int(time.time())}.json"
-        
-        # Convert to JSON-serializable format
-        enrichment_data = []
-        for enhanced_track, enrichment_info in enriched_results:
-            enrichment_data.append({
-                'original': enrichment_info['original_track'],
-                'enhanced': enhanced_track.to_dict(),
-                'enrichment': enrichment_info
-            })
-        
+
+        # Stream records out one at a time instead of materializing a
+        # second full list of dicts plus its serialized string in memory.
         with open(enriched_file, 'w') as f:
-            json.dump(enrichment_data, f, indent=2, default=str)
-        
+            f.write('[')
+            for idx, (enhanced_track, enrichment_info) in enumerate(enriched_results):
+                if idx:
+                    f.write(',')
+                record = {
+                    'original': enrichment_info['original_track'],
+                    'enhanced': enhanced_track.to_dict(),
+                    'enrichment': enrichment_info
+                }
+                f.write(json.dumps(record, default=str))
+            f.write(']')
+
         print(f"💾 Enriched data saved to: {enriched_file}")
     
     return enriched_results
@@ -372,17 +453,16 @@ def dedup_youtube_music_command(args):
                 'artist': g['artist'],
                 'similarity_scores': g['similarity_scores'],
                 'duplicates': [
-                    (d.__dict__ if hasattr(d, '__dict__') else d) for d in g['duplicates']
+                    (asdict(d) if is_dataclass(d) else d) for d in g['duplicates']
                 ]
             })
-        with open(json_path, 'w') as f:
-            json.dump({
-                'total_library_songs': len(songs),
-                'duplicate_groups': len(groups),
-                'total_duplicates': total_dup_tracks,
-                'can_remove': can_remove,
-                'groups': serializable
-            }, f, indent=2)
+        _dump_json_pretty({
+            'total_library_songs': len(songs),
+            'duplicate_groups': len(groups),
+            'total_duplicates': total_dup_tracks,
+            'can_remove': can_remove,
+            'groups': serializable
+        }, json_path)
         print(f"💾 Exported duplicate report: {json_path}")
 
     # Optional playlist creation
@@ -476,8 +556,7 @@ def clean_youtube_music_command(args):
                 for e in plan.playlist_edits
             ]
         }
-        with open(args.save_plan, 'w') as f:
-            json.dump(out, f, indent=2)
+        _dump_json(out, args.save_plan)
         print(f"💾 Saved plan to {args.save_plan}")
 
     # Apply if not dry-run
@@ -495,8 +574,7 @@ def clean_youtube_music_command(args):
             for e in summary['errors']:
                 print(f"   - {e}")
         if args.save_undo and summary.get('undo'):
-            with open(args.save_undo, 'w') as f:
-                json.dump(summary['undo'], f, indent=2)
+            _dump_json(summary['undo'], args.save_undo)
             print(f"💾 Saved undo log to {args.save_undo}")
     else:
         print("\nℹ️ Dry run — no changes applied")
@@ -517,9 +595,7 @@ def rollback_youtube_music_command(args):
         print(f"❌ Undo log not found: {args.undo_log}")
         return None
 
-    data = None
-    with open(args.undo_log, 'r') as f:
-        data = json.load(f)
+    data = _load_json(args.undo_log)
 
     dedup = YouTubeMusicDeduplicator(args.headers)
     if not dedup.is_available():
@@ -669,11 +745,19 @@ def convert_headers_command(args):
         print(f"❌ Raw headers file not found: {raw_path}")
         return None
     headers = {}
-    for line in raw_path.read_text().splitlines():
-        if not line.strip() or ':' not in line:
-            continue
-        key, val = line.split(':', 1)
-        headers[key.strip()] = val.strip()
+    # Stream the file line-by-line rather than materializing the whole
+    # dump via read_text().splitlines().
+    http_methods = ('GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS')
+    with raw_path.open('r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or ':' not in line:
+                continue
+            # Skip an HTTP request line (e.g. "POST https://... HTTP/1.1")
+            if line.startswith(http_methods):
+                continue
+            key, val = line.split(':', 1)
+            headers[key.strip()] = val.strip()
 
     # Ensure required defaults if missing
     headers.setdefault('X-Goog-AuthUser', '0')
@@ -7,7 +7,7 @@ import csv
 from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 import time
 
 from ..core.models import Track, Library, TrackMatcher
@@ -57,15 +57,12 @@ class ComparisonResult:
         self.total_matches = len(self.matches)
         
         if self.matches:
-            # Count match types
-            for match in self.matches:
-                if match.match_type == 'exact':
-                    self.exact_matches += 1
-                elif match.match_type == 'fuzzy':
-                    self.fuzzy_matches += 1
-                elif match.match_type == 'isrc':
-                    self.isrc_matches += 1
-            
+            # Count match types in one C-level pass
+            type_counts = Counter(match.match_type for match in self.matches)
+            self.exact_matches = type_counts['exact']
+            self.fuzzy_matches = type_counts['fuzzy']
+            self.isrc_matches = type_counts['isrc']
+
             # Calculate averages
             self.avg_confidence = sum(m.confidence for m in self.matches) / len(self.matches)
         
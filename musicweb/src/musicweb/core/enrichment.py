@@ -2,27 +2,50 @@
 Music metadata enrichment using MusicBrainz and other services.
 """
 
+import threading
 import time
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import quote_plus
 import re
 
 from ..core.models import Track
 
+# Optional C-backed JSON parser for large API payloads
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
 
 class MusicBrainzEnricher:
     """Enrich track metadata using MusicBrainz API."""
-    
+
     def __init__(self, user_agent: str = "MusicLibraryTool/1.0"):
         self.base_url = "https://musicbrainz.org/ws/2"
         self.headers = {
             'User-Agent': user_agent,
             'Accept': 'application/json'
         }
+        # One Session for all requests: keep-alive spares a TCP/TLS
+        # handshake per call, which matters at 1 request/second pacing.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         self.rate_limit_delay = 1.2  # MusicBrainz requires 1 request per second
         self.last_request_time = 0
+        # Serializes rate-limit bookkeeping so concurrent callers still
+        # honor the global 1 request/second budget.
+        self._rate_lock = threading.Lock()
+
+    @staticmethod
+    def _parse_json(response) -> Dict[str, Any]:
+        """Parse a response body, preferring orjson when installed."""
+        if HAVE_ORJSON:
+            return orjson.loads(response.content)
+        return response.json()
     
     def enrich_track(self, track: Track) -> Optional[Dict[str, Any]]:
         """Enrich a single track with MusicBrainz data."""
@@ -73,13 +96,14 @@ class MusicBrainzEnricher:
     
     def _respect_rate_limit(self) -> None:
         """Ensure we don't exceed MusicBrainz rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
-        
-        self.last_request_time = time.time()
+        with self._rate_lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+
+            if time_since_last < self.rate_limit_delay:
+                time.sleep(self.rate_limit_delay - time_since_last)
+
+            self.last_request_time = time.time()
     
     def _search_by_isrc(self, isrc: str) -> Optional[Dict[str, Any]]:
         """Search MusicBrainz by ISRC."""
@@ -91,10 +115,10 @@ class MusicBrainzEnricher:
                 'limit': 1
             }
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = self._parse_json(response)
             recordings = data.get('recordings', [])
             
             if recordings:
@@ -129,10 +153,10 @@ class MusicBrainzEnricher:
                     'limit': 5  # Get multiple results to find best match
                 }
                 
-                response = requests.get(url, headers=self.headers, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 response.raise_for_status()
                 
-                data = response.json()
+                data = self._parse_json(response)
                 recordings = data.get('recordings', [])
                 
                 if recordings:
@@ -171,10 +195,10 @@ class MusicBrainzEnricher:
                     'limit': 3
                 }
                 
-                response = requests.get(url, headers=self.headers, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 response.raise_for_status()
                 
-                data = response.json()
+                data = self._parse_json(response)
                 recordings = data.get('recordings', [])
                 
                 if recordings:
@@ -401,21 +425,28 @@ class EnrichmentManager:
         
         return enhanced_track
     
-    def bulk_enrich(self, tracks: List[Track], 
+    def bulk_enrich(self, tracks: List[Track],
                    progress_callback: Optional[callable] = None) -> List[Tuple[Track, Dict[str, Any]]]:
-        """Enrich multiple tracks and return enhanced versions."""
-        enriched_tracks = []
-        
-        for i, track in enumerate(tracks):
-            if progress_callback:
-                progress_callback(i, len(tracks), f"Enriching: {track.title}")
-            
+        """Enrich multiple tracks and return enhanced versions.
+
+        Lookups run on a small thread pool so cache hits, response parsing,
+        and network waits overlap; the enricher's shared rate limiter still
+        serializes actual API calls to one per second.
+        """
+        def enrich_one(track: Track) -> Tuple[Track, Dict[str, Any]]:
             enrichment_data = self.enrich_track(track)
             enhanced_track = self.apply_enrichment(track, enrichment_data)
-            
-            enriched_tracks.append((enhanced_track, enrichment_data))
-        
+            return enhanced_track, enrichment_data
+
+        enriched_tracks = []
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for i, result in enumerate(executor.map(enrich_one, tracks)):
+                if progress_callback:
+                    progress_callback(i, len(tracks), f"Enriching: {tracks[i].title}")
+                enriched_tracks.append(result)
+
         if progress_callback:
             progress_callback(len(tracks), len(tracks), "Enrichment complete")
-        
+
         return enriched_tracks
\ No newline at end of file
@@ -12,6 +12,7 @@ from collections import defaultdict
 # Optional dependencies with fallbacks
 try:
     from rapidfuzz import fuzz, process
+    from rapidfuzz.distance import JaroWinkler, Levenshtein
     HAVE_RAPIDFUZZ = True
 except ImportError:
     HAVE_RAPIDFUZZ = False
@@ -155,7 +156,20 @@ class TrackNormalizer:
         r'\([^)]*[Dd]eluxe[^)]*\)',
         r'\([^)]*[Ee]xtended[^)]*\)',
     ]
-    
+
+    # Pattern lists fused into single alternations and compiled at class
+    # creation; normalization runs once per track so per-call re.compile
+    # and per-pattern passes add up on large libraries.
+    _FEATURING_RE = re.compile('|'.join(FEATURING_PATTERNS), re.IGNORECASE)
+    _VERSION_RE = re.compile('|'.join(VERSION_PATTERNS), re.IGNORECASE)
+    _WS_RE = re.compile(r'\s+')
+    _PARENS_RE = re.compile(r'\([^)]*\)')
+    _BRACKETS_RE = re.compile(r'\[[^\]]*\]')
+    _PUNCT_RE = re.compile(r'[^\w\s]')
+    _LEADING_THE_RE = re.compile(r'^(the\s+)')
+    _TRAILING_THE_RE = re.compile(r'\s+(the)$')
+    _NAME_SUFFIX_RE = re.compile(r'\s+(jr\.?|sr\.?|iii?|iv)$', re.IGNORECASE)
+
     @staticmethod
     def normalize_title(title: str) -> str:
         """Normalize track title for comparison."""
@@ -164,33 +178,30 @@ class TrackNormalizer:
         
         # Basic cleaning
         normalized = title.strip().lower()
-        
+
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
+        normalized = TrackNormalizer._WS_RE.sub(' ', normalized)
+
         # Preserve version info but remove other parentheses
-        versions = []
-        for pattern in TrackNormalizer.VERSION_PATTERNS:
-            matches = re.findall(pattern, normalized, re.IGNORECASE)
-            versions.extend(matches)
-            normalized = re.sub(pattern, '', normalized, flags=re.IGNORECASE)
-        
+        versions = TrackNormalizer._VERSION_RE.findall(normalized)
+        normalized = TrackNormalizer._VERSION_RE.sub('', normalized)
+
         # Remove other parentheses content
-        normalized = re.sub(r'\([^)]*\)', '', normalized)
-        normalized = re.sub(r'\[[^\]]*\]', '', normalized)
-        
+        normalized = TrackNormalizer._PARENS_RE.sub('', normalized)
+        normalized = TrackNormalizer._BRACKETS_RE.sub('', normalized)
+
         # Add back version info
         if versions:
             normalized += ' ' + ' '.join(versions)
-        
+
         # Remove common prefixes/suffixes
-        normalized = re.sub(r'^(the\s+)', '', normalized)
-        normalized = re.sub(r'\s+(the)$', '', normalized)
-        
+        normalized = TrackNormalizer._LEADING_THE_RE.sub('', normalized)
+        normalized = TrackNormalizer._TRAILING_THE_RE.sub('', normalized)
+
         # Remove punctuation
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
+        normalized = TrackNormalizer._PUNCT_RE.sub(' ', normalized)
+        normalized = TrackNormalizer._WS_RE.sub(' ', normalized).strip()
+
         return normalized
     
     @staticmethod
@@ -200,17 +211,16 @@ class TrackNormalizer:
             return ""
         
         normalized = artist.strip().lower()
-        
-        # Remove featuring artists
-        for pattern in TrackNormalizer.FEATURING_PATTERNS:
-            normalized = re.sub(pattern, '', normalized, flags=re.IGNORECASE)
-        
+
+        # Remove featuring artists (single fused alternation pass)
+        normalized = TrackNormalizer._FEATURING_RE.sub('', normalized)
+
         # Remove common suffixes
-        normalized = re.sub(r'\s+(jr\.?|sr\.?|iii?|iv)$', '', normalized, flags=re.IGNORECASE)
-        
+        normalized = TrackNormalizer._NAME_SUFFIX_RE.sub('', normalized)
+
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
+        normalized = TrackNormalizer._WS_RE.sub(' ', normalized).strip()
+
         return normalized
     
     @staticmethod
@@ -369,9 +379,12 @@ class TrackMatcher:
         if cache_key in self._similarity_cache:
             return self._similarity_cache[cache_key]
         
-        # Calculate similarity
+        # Calculate similarity. This path only serves artist names (the
+        # equality check above handles the common case); Jaro-Winkler is
+        # O(n) with prefix weighting, a better fit for short names with
+        # punctuation/typo diffs than the O(n^2) edit-distance ratio.
         if HAVE_RAPIDFUZZ:
-            similarity = fuzz.ratio(str1_norm, str2_norm) / 100.0
+            similarity = JaroWinkler.normalized_similarity(str1_norm, str2_norm)
         else:
             # Simple fallback similarity
             similarity = 1.0 if str1_norm == str2_norm else 0.0
@@ -519,7 +532,15 @@ class TrackMatcher:
         if not HAVE_RAPIDFUZZ:
             # Fallback to simple comparison
             return 1.0 if title1.lower() == title2.lower() else 0.0
-        
+
+        # Fast path: near-identical titles (the common case for real
+        # matches) are settled by bit-parallel Levenshtein alone. The
+        # score_cutoff makes rapidfuzz bail out almost immediately on
+        # dissimilar pairs, so a miss here costs next to nothing.
+        lev = Levenshtein.normalized_similarity(title1, title2, score_cutoff=0.95)
+        if lev >= 0.95:
+            return min(1.0, lev * 1.02)
+
         # Use multiple fuzzy matching methods
         token_set = fuzz.token_set_ratio(title1, title2) / 100.0
         token_sort = fuzz.token_sort_ratio(title1, title2) / 100.0
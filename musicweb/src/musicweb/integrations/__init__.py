@@ -7,10 +7,10 @@ including YouTube Music API, playlist management, and deduplication services.
 
 from .youtube_music import YouTubeMusicAPI
 from .playlist import PlaylistManager
-from .deduplication import DeduplicationService
+from .deduplication import YouTubeMusicDeduplicator
 
 __all__ = [
     "YouTubeMusicAPI",
-    "PlaylistManager", 
-    "DeduplicationService"
+    "PlaylistManager",
+    "YouTubeMusicDeduplicator"
 ]
\ No newline at end of file
@@ -8,21 +8,60 @@ and optionally create a playlist containing the duplicates.
 
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+import os
+import pickle
 import re
+import time
 
 try:
     from ytmusicapi import YTMusic  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     YTMusic = None  # type: ignore
 
+# Optional C-backed fuzzy matching (much faster than difflib)
+try:
+    from rapidfuzz import fuzz
+    HAVE_RAPIDFUZZ = True
+except ImportError:
+    HAVE_RAPIDFUZZ = False
+
+# Compiled once at import; _normalize runs for every title/artist in a scan.
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
+# Disk cache for library fetches (opt-in via get_library_songs(use_cache=True)).
+# Overridable for shared hosts or tests; the Path is built once at import.
+_CACHE_DIR = Path(os.environ.get("MUSICWEB_CACHE_DIR",
+                                 str(Path.home() / ".cache" / "musicweb")))
+
 
 @dataclass
 class RankedDuplicate:
+    # Slots instead of per-instance __dict__: a large library scan creates
+    # one of these per duplicate, so the fixed layout saves real memory and
+    # speeds attribute access. (dataclass slots=True needs 3.10; we support 3.8.)
+    __slots__ = (
+        "id",
+        "title",
+        "album",
+        "source",
+        "quality",
+        "quality_score",
+        "duration",
+        "thumbnail",
+        "artists",
+        "is_explicit",
+        "original_data",
+    )
+
     id: str
     title: str
     album: str
@@ -70,24 +109,75 @@ class YouTubeMusicDeduplicator:
             self.ytmusic = None
             return False
 
-    def get_library_songs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Fetch library songs and cache them locally."""
+    def get_library_songs(
+        self,
+        limit: Optional[int] = None,
+        use_cache: bool = False,
+        cache_ttl: int = 3600,
+    ) -> List[Dict[str, Any]]:
+        """Fetch library songs and cache them locally.
+
+        With `use_cache=True`, responses are persisted to
+        ``~/.cache/musicweb`` and reused while younger than `cache_ttl`
+        seconds, so repeat scans skip the (minutes-long) network fetch.
+        """
         if not self.ytmusic:
             raise RuntimeError("Not authenticated with YouTube Music")
+
+        cache_path = _CACHE_DIR / f"library_songs_{limit if limit is not None else 'all'}.pkl"
+        if use_cache:
+            # EAFP: a missing file surfaces as OSError from stat(), saving
+            # the separate exists() check (two stat syscalls become one).
+            try:
+                if time.time() - cache_path.stat().st_mtime < cache_ttl:
+                    self.library_songs = pickle.loads(cache_path.read_bytes())
+                    return self.library_songs
+            except Exception:
+                pass  # Missing or corrupt cache — fall through to a fresh fetch
+
         songs = self.ytmusic.get_library_songs(limit=limit)
         self.library_songs = songs or []
+
+        if use_cache:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(
+                    pickle.dumps(self.library_songs, protocol=pickle.HIGHEST_PROTOCOL)
+                )
+            except OSError:
+                pass  # Cache write failures must not break the fetch
         return self.library_songs
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _normalize(text: str) -> str:
+        # Memoized: artist names especially repeat across a library, so the
+        # regex work runs once per distinct string rather than once per song.
         if not text:
             return ""
-        normalized = re.sub(r"[^\w\s]", "", text.lower().strip())
-        return re.sub(r"\s+", " ", normalized)
+        normalized = _PUNCT_RE.sub("", text.lower().strip())
+        return _WS_RE.sub(" ", normalized)
 
     @classmethod
     def _similarity(cls, a: str, b: str) -> float:
-        return SequenceMatcher(None, cls._normalize(a), cls._normalize(b)).ratio()
+        return cls._similarity_normalized(cls._normalize(a), cls._normalize(b))
+
+    @staticmethod
+    def _similarity_normalized(
+        norm_a: str, norm_b: str, score_cutoff: Optional[float] = None
+    ) -> float:
+        """Similarity for strings already passed through :meth:`_normalize`.
+
+        `score_cutoff` (0..1) lets rapidfuzz bail out early once a pair can
+        no longer reach the threshold; scores below it come back as 0.
+
+        With rapidfuzz this is token_set_ratio, so word order and extra
+        tokens ("Hey Jude (Remastered)" vs "Hey Jude") don't sink the score.
+        """
+        if HAVE_RAPIDFUZZ:
+            cutoff = score_cutoff * 100.0 if score_cutoff is not None else None
+            return fuzz.token_set_ratio(norm_a, norm_b, score_cutoff=cutoff) / 100.0
+        return SequenceMatcher(None, norm_a, norm_b).ratio()
 
     def find_duplicates(self, similarity_threshold: float = 0.85) -> List[Dict[str, Any]]:
         """Group likely duplicates using title+artist similarity.
@@ -97,10 +187,86 @@ class YouTubeMusicDeduplicator:
         if not self.library_songs:
             return []
 
+        songs = self.library_songs
+
+        # Normalize each song's title and artists exactly once up front
+        # instead of re-normalizing inside the O(N^2) pair loop, and build an
+        # inverted artist -> song-indices index so each song is only compared
+        # against songs sharing at least one artist name, not the whole
+        # library.
+        norm_titles = [self._normalize(s.get("title", "")) for s in songs]
+        norm_artists = []
+        norm_artist_lists = []
+        artist_index: Dict[str, List[int]] = defaultdict(list)
+        for idx, s in enumerate(songs):
+            names = [self._normalize(a.get("name", "")) for a in s.get("artists", [])] or [""]
+            norm_artists.append(names[0])
+            norm_artist_lists.append(names)
+            for name in names:
+                artist_index[name].append(idx)
+
+        # Title lengths for the bounds check below; computed once.
+        title_lens = [len(t) for t in norm_titles]
+
+        def title_sim(i: int, j: int) -> float:
+            if not HAVE_RAPIDFUZZ:
+                # Length bound: SequenceMatcher.ratio() = 2M/(len_a+len_b)
+                # <= 1 - |len_a-len_b|/(len_a+len_b). If even that upper
+                # bound misses the threshold, skip the scorer entirely.
+                # (Doesn't hold for token_set_ratio, which ignores extra
+                # tokens by design.)
+                total = title_lens[i] + title_lens[j]
+                if total and 1.0 - abs(title_lens[i] - title_lens[j]) / total < similarity_threshold:
+                    return 0.0
+            return self._similarity_normalized(
+                norm_titles[i], norm_titles[j], score_cutoff=similarity_threshold
+            )
+
+        def artist_sim(i: int, j: int) -> float:
+            if norm_artists[i] == norm_artists[j]:
+                return 1.0
+            return self._similarity_normalized(
+                norm_artists[i], norm_artists[j], score_cutoff=similarity_threshold
+            )
+
+        video_ids = [s.get("videoId") for s in songs]
+
+        def matches_for(i: int) -> List[tuple]:
+            """Score song i against its candidates; returns (j, t_sim, a_sim)."""
+            # Candidates: songs after i that share at least one artist name.
+            candidates = sorted(
+                {j for name in norm_artist_lists[i] for j in artist_index.get(name, ()) if j > i}
+            )
+            out = []
+            for j in candidates:
+                # Same videoId means the same upload listed twice — a
+                # certain duplicate, no similarity work needed.
+                if video_ids[i] and video_ids[i] == video_ids[j]:
+                    out.append((j, 1.0, 1.0))
+                    continue
+                t_sim = title_sim(i, j)
+                if t_sim < similarity_threshold:
+                    continue
+                a_sim = artist_sim(i, j)
+                if a_sim >= similarity_threshold:
+                    out.append((j, t_sim, a_sim))
+            return out
+
+        # Scoring only reads the precomputed arrays, so it parallelizes
+        # cleanly; rapidfuzz releases the GIL inside its C scorers, so a
+        # thread pool uses all cores without pickling the library the way a
+        # process pool would. Greedy grouping below stays sequential (and
+        # order-dependent) so results are identical to the serial scan.
+        if HAVE_RAPIDFUZZ and len(songs) > 500:
+            with ThreadPoolExecutor() as executor:
+                all_matches = list(executor.map(matches_for, range(len(songs)), chunksize=32))
+        else:
+            all_matches = [matches_for(i) for i in range(len(songs))]
+
         groups: List[Dict[str, Any]] = []
         processed: set[int] = set()
 
-        for i, song1 in enumerate(self.library_songs):
+        for i, song1 in enumerate(songs):
             if i in processed:
                 continue
 
@@ -114,21 +280,13 @@ class YouTubeMusicDeduplicator:
             rep_title_sim = 1.0
             rep_artist_sim = 1.0
 
-            for j, song2 in enumerate(self.library_songs[i + 1 :], i + 1):
+            for j, t_sim, a_sim in all_matches[i]:
                 if j in processed:
                     continue
-
-                title2 = song2.get("title", "")
-                artists2 = [a.get("name", "") for a in song2.get("artists", [])]
-                artist2 = artists2[0] if artists2 else ""
-
-                t_sim = self._similarity(title1, title2)
-                a_sim = self._similarity(artist1, artist2)
-                if t_sim >= similarity_threshold and a_sim >= similarity_threshold:
-                    current_group.append(song2)
-                    idx_group.add(j)
-                    rep_title_sim = min(rep_title_sim, t_sim)
-                    rep_artist_sim = min(rep_artist_sim, a_sim)
+                current_group.append(songs[j])
+                idx_group.add(j)
+                rep_title_sim = min(rep_title_sim, t_sim)
+                rep_artist_sim = min(rep_artist_sim, a_sim)
 
             if len(current_group) > 1:
                 ranked = self._rank_duplicates(current_group)
@@ -213,7 +371,22 @@ class YouTubeMusicDeduplicator:
             raise RuntimeError("Not authenticated with YouTube Music")
         playlist_id = self.ytmusic.create_playlist(title=title, description=description)
         if song_ids:
-            self.ytmusic.add_playlist_items(playlist_id, song_ids)
+            # Add in batches of 100 (the endpoint accepts well over 50, and
+            # bigger batches amortize the per-request overhead); each batch
+            # is an independent HTTPS call, so dispatch them through a small
+            # thread pool rather than serially (bounded workers keep us
+            # under API rate limits).
+            batches = [song_ids[i:i + 100] for i in range(0, len(song_ids), 100)]
+            if len(batches) == 1:
+                self.ytmusic.add_playlist_items(playlist_id, batches[0])
+            else:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    futures = [
+                        executor.submit(self.ytmusic.add_playlist_items, playlist_id, batch)
+                        for batch in batches
+                    ]
+                    for future in futures:
+                        future.result()
         return playlist_id
 
     def create_duplicates_playlist(
@@ -268,7 +441,9 @@ class YouTubeMusicDeduplicator:
                 ids.extend([vid for i, vid in enumerate(dup_ids) if i != preferred_idx])
             else:
                 ids.extend(dup_ids)
-        ids = [i for i in ids if i]
+        # Drop empties and repeated ids (order-preserving) so the same video
+        # is never added to the playlist twice
+        ids = list(dict.fromkeys(i for i in ids if i))
         if not ids:
             return {"success": False, "error": "No songs to add"}
 
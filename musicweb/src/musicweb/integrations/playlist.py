@@ -19,12 +19,43 @@ except ImportError:
     HAVE_YTMUSIC = False
 
 
+class _RateLimiter:
+    """Pace API calls to a minimum interval instead of fixed sleeps.
+
+    Only sleeps for whatever remains of the interval after the previous
+    call, and doubles the interval when the API pushes back (rate-limit
+    errors), recovering to the base interval on success.
+    """
+
+    def __init__(self, min_interval: float = 0.2, max_interval: float = 5.0):
+        self.base_interval = min_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._last_call = 0.0
+
+    def wait(self) -> None:
+        """Block until at least min_interval has passed since the last call."""
+        delay = self.min_interval - (time.monotonic() - self._last_call)
+        if delay > 0:
+            time.sleep(delay)
+        self._last_call = time.monotonic()
+
+    def backoff(self) -> None:
+        """Exponentially widen the interval after a rate-limit response."""
+        self.min_interval = min(self.min_interval * 2, self.max_interval)
+
+    def reset(self) -> None:
+        """Restore the base interval after a successful call."""
+        self.min_interval = self.base_interval
+
+
 class PlaylistManager:
     """Manage playlist creation and track searching."""
-    
+
     def __init__(self, headers_file: Optional[str] = None):
         self.ytmusic = None
         self.headers_file = headers_file
+        self._rate_limiter = _RateLimiter()
         
         if HAVE_YTMUSIC and headers_file and Path(headers_file).exists():
             try:
@@ -157,9 +188,6 @@ class PlaylistManager:
                 else:
                     added_tracks.extend(batch_results['added'])
                     failed_tracks.extend(batch_results['failed'])
-                
-                # Rate limiting
-                time.sleep(1.2)  # Respect API limits
             
             if progress_callback:
                 progress_callback(len(tracks), len(tracks), "Playlist creation complete")
@@ -203,7 +231,10 @@ class PlaylistManager:
                     if video_id:
                         # Add to playlist with error handling
                         try:
+                            # Pace the call instead of sleeping a fixed amount
+                            self._rate_limiter.wait()
                             result = self.ytmusic.add_playlist_items(playlist_id, [video_id])
+                            self._rate_limiter.reset()
                             if result:  # Check if addition was successful
                                 added_tracks.append({
                                     'original_track': track.to_dict(),
@@ -217,6 +248,9 @@ class PlaylistManager:
                                 })
                         except Exception as add_error:
                             error_msg = str(add_error)
+                            if "429" in error_msg or "Expecting value" in error_msg:
+                                # Likely rate limited — widen the pacing interval
+                                self._rate_limiter.backoff()
                             if "Expecting value" in error_msg:
                                 error_msg = f"YouTube Music API returned invalid response (possible rate limit or authentication issue): {error_msg}"
                             failed_tracks.append({
@@ -233,10 +267,7 @@ class PlaylistManager:
                         'track': track.to_dict(),
                         'reason': 'No suitable match found'
                     })
-                
-                # Small delay between requests
-                time.sleep(0.1)
-            
+
             except Exception as e:
                 failed_tracks.append({
                     'track': track.to_dict(),
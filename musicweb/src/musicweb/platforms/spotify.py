@@ -12,6 +12,13 @@ import pandas as pd
 from .base import BasePlatformParser
 from ..core.models import Track, Library, TrackNormalizer
 
+# Optional C-backed JSON parser for large exports
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
 class SpotifyParser(BasePlatformParser):
     """Parser for Spotify CSV exports."""
     
@@ -43,9 +50,12 @@ class SpotifyParser(BasePlatformParser):
     def _parse_json(self, file_path: Path, library: Library) -> Library:
         """Parse Spotify JSON export."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            if HAVE_ORJSON:
+                data = orjson.loads(file_path.read_bytes())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
             # Handle different JSON structures
             tracks_data = data
             if isinstance(data, dict):
@@ -3,6 +3,7 @@ File handling utilities.
 """
 
 import os
+import stat
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -47,15 +48,21 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
         'encoding': None
     }
     
-    if path.exists():
-        info['exists'] = True
-        info['is_file'] = path.is_file()
-        
-        if path.is_file():
-            info['size_bytes'] = path.stat().st_size
-            info['size_mb'] = info['size_bytes'] / (1024 * 1024)
-            info['encoding'] = detect_encoding(str(path))
-    
+    # One stat() answers exists/is_file/size in a single syscall; the old
+    # exists() + is_file() + stat() chain cost three.
+    try:
+        file_stat = path.stat()
+    except OSError:
+        return info
+
+    info['exists'] = True
+    info['is_file'] = stat.S_ISREG(file_stat.st_mode)
+
+    if info['is_file']:
+        info['size_bytes'] = file_stat.st_size
+        info['size_mb'] = info['size_bytes'] / (1024 * 1024)
+        info['encoding'] = detect_encoding(str(path))
+
     return info
 
 
@@ -6,15 +6,26 @@ A comprehensive web interface for comparing and managing music libraries
 across multiple streaming platforms.
 """
 
+import gc
+import hashlib
+import html
 import json
+import os
+import re
+import shutil
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import sqlite3
 import io
+from collections import Counter
+from dataclasses import asdict, is_dataclass
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import sys
 from pathlib import Path
@@ -63,20 +74,38 @@ except Exception:
     YTMusicCleaner = None
 from musicweb.web.playlist_audit import parse_playlist_bytes, audit_playlist
 
-# Try to import optional visualization dependencies
+# Check for the optional charting dependency without importing it:
+# plotly (and the matplotlib stack the old import dragged in) costs
+# hundreds of ms at startup, so the actual import happens lazily in the
+# chart blocks that need it.
+from importlib.util import find_spec
+
+HAVE_VISUALIZATION = find_spec('plotly') is not None
+
+# Optional C-backed JSON for large download payloads
 try:
-    import matplotlib.pyplot as plt
-    from matplotlib_venn import venn2, venn3
-    import plotly.express as px
-    import plotly.graph_objects as go
-    HAVE_VISUALIZATION = True
+    import orjson
+    HAVE_ORJSON = True
 except ImportError:
-    HAVE_VISUALIZATION = False
+    HAVE_ORJSON = False
+
+
+def _json_dumps_pretty(obj) -> bytes:
+    """Indented JSON bytes for download payloads, via orjson when present."""
+    if HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
 
 import base64
 
+@st.cache_data(show_spinner=False)
 def get_logo_base64():
-    """Get the logo as base64 encoded string."""
+    """Get the logo as base64 encoded string.
+
+    Cached: Streamlit reruns the whole script on every interaction and the
+    logo is rendered several times per pass, so without caching the file
+    read + base64 encode repeats on each click.
+    """
     try:
         # Use importlib.resources for proper package resource access
         try:
@@ -391,12 +420,70 @@ class SessionManager:
             st.session_state.ytm_headers_path = None
         if 'ytm_dedup_selected_group_ids' not in st.session_state:
             st.session_state.ytm_dedup_selected_group_ids = []
-    
+        if 'global_artist_counts' not in st.session_state:
+            # Artist -> number of loaded libraries containing them; its len()
+            # is the distinct-artist total, maintained incrementally so the
+            # overview never re-unions every artist set per rerun.
+            st.session_state.global_artist_counts = Counter()
+
+    @staticmethod
+    def _retire_artists(library: Library):
+        """Drop one reference per artist of `library` from the tally."""
+        counts = st.session_state.global_artist_counts
+        for artist in library.artist_counts.keys():
+            counts[artist] -= 1
+            if counts[artist] <= 0:
+                del counts[artist]
+
     @staticmethod
     def add_library(name: str, library: Library):
-        """Add library to session state."""
+        """Add library to session state, keeping the artist tally current."""
+        previous = st.session_state.libraries.get(name)
+        if previous is not None:
+            SessionManager._retire_artists(previous)
+        st.session_state.global_artist_counts.update(library.artist_counts.keys())
         st.session_state.libraries[name] = library
-    
+
+    @staticmethod
+    def remove_library(name: str):
+        """Remove a library plus every piece of derived state pinning it.
+
+        Comparison results, enrichment output, and analysis results all
+        hold references into the Library's tracks; leaving them in place
+        keeps hundreds of MB alive for large libraries after removal.
+        """
+        library = st.session_state.libraries.pop(name, None)
+        if library is None:
+            return
+
+        SessionManager._retire_artists(library)
+        # Allow any still-attached upload to be loaded again; the
+        # library name can't be mapped back to a single file key.
+        st.session_state.get('loaded_file_keys', set()).clear()
+
+        # Comparison results are keyed (source, target, *options)
+        for key in [k for k in st.session_state.comparison_results
+                    if name in k[:2]]:
+            del st.session_state.comparison_results[key]
+
+        st.session_state.enrichment_data.pop(f"{name}_enriched", None)
+
+        analysis_key = st.session_state.get('analysis_key')
+        if analysis_key and name in analysis_key[0]:
+            st.session_state.pop('analysis_results', None)
+            st.session_state.pop('analysis_key', None)
+
+        # These caches key on id() of the ComparisonResults; once the
+        # results are dropped and gc runs, a recycled id could hit a
+        # stale entry, and the cached frames would pin the removed
+        # library's data regardless.
+        _matches_frame.clear()
+        _missing_frame.clear()
+        _confidence_hist.clear()
+        _df_to_csv_bytes.clear()
+
+        gc.collect()
+
     @staticmethod
     def get_library(name: str) -> Optional[Library]:
         """Get library from session state."""
@@ -426,8 +513,29 @@ def render_header():
         """.format(logo_base64=get_logo_base64()), unsafe_allow_html=True)
 
 
-def render_sidebar():
-    """Render the sidebar with file uploads and library management."""
+# Page labels for the sidebar selector; only the chosen page's render
+# function runs per rerun (st.tabs executes every tab body).
+PAGES = [
+    "📊 Overview",
+    "🔍 Compare",
+    "📊 Analyze",
+    "📝 Playlist Audit",
+    "🧹 YTM Dedup",
+    "🧽 Playlist Cleanup",
+    "🔍 Enrich",
+    "ℹ️ Help",
+]
+LIBRARY_PAGES = {"📊 Overview", "🔍 Compare", "📊 Analyze", "📝 Playlist Audit", "🔍 Enrich"}
+YTM_PAGES = {"🧹 YTM Dedup", "🧽 Playlist Cleanup"}
+
+
+def render_sidebar(page: str):
+    """Render the sidebar with file uploads and library management.
+
+    Heavy sections render only for the pages that use them: library
+    management for the library pages, YouTube Music setup for the
+    dedup/cleanup pages.
+    """
     # Small logo in sidebar
     if get_logo_base64():
         st.sidebar.markdown(f"""
@@ -436,8 +544,16 @@ def render_sidebar():
         </div>
         """, unsafe_allow_html=True)
     
+    if page in LIBRARY_PAGES:
+        _render_library_sidebar()
+    if page in YTM_PAGES:
+        _render_ytm_sidebar()
+
+
+def _render_library_sidebar():
+    """Library upload and management sections."""
     st.sidebar.header("▶ Library Management")
-    
+
     # File upload section with better UX
     with st.sidebar.expander("⬆ Upload Library Files", expanded=True):
         st.markdown("""
@@ -460,25 +576,26 @@ def render_sidebar():
         )
         
         if uploaded_files:
-            for uploaded_file in uploaded_files:
-                # Enhanced file loading with better feedback
-                if st.button(f"📤 Load {uploaded_file.name}", key=f"load_{uploaded_file.name}", use_container_width=True):
-                    with st.spinner(f"Loading {uploaded_file.name}..."):
-                        progress_bar = st.progress(0)
-                        progress_bar.progress(0.3)
-                        
-                        success = load_uploaded_file(uploaded_file)
-                        
-                        progress_bar.progress(1.0)
-                        
-                        if success:
-                            progress_bar.empty()
-                            st.balloons()
-                            st.success(f"✅ Successfully loaded {uploaded_file.name}")
-                            time.sleep(1)  # Brief pause to show success
-                            st.rerun()
-                        else:
-                            progress_bar.empty()
+            # One button instead of one per file: avoids rebuilding O(files)
+            # widgets each rerun, and already-loaded uploads are skipped.
+            loaded_keys = st.session_state.setdefault('loaded_file_keys', set())
+            pending = [f for f in uploaded_files if (f.name, f.size) not in loaded_keys]
+
+            if not pending:
+                st.caption("All uploaded files are loaded.")
+            elif st.button(f"📤 Load {len(pending)} file(s)", use_container_width=True):
+                loaded = 0
+                with st.spinner("Loading libraries..."):
+                    for uploaded_file in pending:
+                        if load_uploaded_file(uploaded_file):
+                            loaded_keys.add((uploaded_file.name, uploaded_file.size))
+                            loaded += 1
+
+                if loaded:
+                    st.balloons()
+                    st.success(f"✅ Successfully loaded {loaded} file(s)")
+                    time.sleep(1)  # Brief pause to show success
+                    st.rerun()
     
     # Existing libraries
     libraries = SessionManager.list_libraries()
@@ -494,10 +611,12 @@ def render_sidebar():
                 st.write(f"**Artists:** {len(library.artist_counts):,}")
                 
                 if st.button(f"Remove {lib_name}", key=f"remove_{lib_name}"):
-                    del st.session_state.libraries[lib_name]
+                    SessionManager.remove_library(lib_name)
                     st.rerun()
-    
-    # YouTube Music setup
+
+
+def _render_ytm_sidebar():
+    """YouTube Music connection section."""
     st.sidebar.header("♫ YouTube Music")
     headers_file = st.sidebar.file_uploader(
         "Upload headers file",
@@ -528,104 +647,301 @@ def render_sidebar():
             # Keep the headers file path for reuse in Dedup tab
 
 
+def _upload_digest(uploaded_file) -> str:
+    """sha256 of the upload's bytes, streamed in 1MiB chunks."""
+    digest = hashlib.sha256()
+    uploaded_file.seek(0)
+    for chunk in iter(lambda: uploaded_file.read(1 << 20), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+@st.cache_resource(show_spinner=False)
+def _parse_library_cached(_uploaded_file, name: str, digest: str):
+    """Parse an uploaded library once per distinct content.
+
+    Keyed on the sha256 of the bytes — the file object itself is skipped
+    by the hasher — so re-clicking Load (or any rerun that re-triggers
+    the upload handler) returns the already-parsed Library, while a
+    different file reusing the same name and size parses fresh. The
+    bytes are streamed to the tempfile in 1MiB chunks instead of
+    materializing a second full copy via getvalue(). Detection failures
+    raise so the miss is not cached against the digest.
+    """
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix=Path(name).suffix) as tmp:
+        _uploaded_file.seek(0)
+        shutil.copyfileobj(_uploaded_file, tmp, length=1 << 20)
+        tmp_path = tmp.name
+
+    try:
+        platform = detect_platform(tmp_path)
+        if not platform:
+            raise ValueError(f"Unsupported file format: {name}")
+
+        parser = create_parser(platform)
+        return platform, parser.parse_file(tmp_path)
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
 def load_uploaded_file(uploaded_file) -> bool:
     """Load an uploaded file into session state with enhanced error handling."""
     try:
-        # Validate file size (max 100MB)
-        file_size = len(uploaded_file.getvalue())
-        if file_size > 100 * 1024 * 1024:  # 100MB limit
+        # Validate file size (max 100MB) without copying the contents
+        if uploaded_file.size > 100 * 1024 * 1024:  # 100MB limit
             st.error("❌ File too large. Maximum size is 100MB.")
             return False
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix=Path(uploaded_file.name).suffix) as tmp:
-            tmp.write(uploaded_file.getvalue())
-            tmp_path = tmp.name
-        
-        # Detect platform
-        platform = detect_platform(tmp_path)
-        
-        if not platform:
+
+        try:
+            platform, library = _parse_library_cached(
+                uploaded_file, uploaded_file.name, _upload_digest(uploaded_file))
+        except ValueError:
             st.error(f"❌ Unsupported file format: {uploaded_file.name}")
-            Path(tmp_path).unlink(missing_ok=True)
             return False
-        
-        # Create parser and load library
-        parser = create_parser(platform)
-        library = parser.parse_file(tmp_path)
-        
+
         # Validate library has content
         if library.total_tracks == 0:
             st.warning(f"⚠️ No tracks found in {uploaded_file.name}")
-            Path(tmp_path).unlink(missing_ok=True)
             return False
-        
+
         # Add to session state with cleaner name
         clean_name = uploaded_file.name.replace('.csv', '').replace('.json', '').replace('.xml', '')
         lib_name = f"{platform.title()} - {clean_name}"
         SessionManager.add_library(lib_name, library)
-        
-        # Cleanup
-        Path(tmp_path).unlink(missing_ok=True)
-        
+
         return True
-    
+
     except Exception as e:
         st.error(f"❌ Error loading {uploaded_file.name}: {str(e)}")
-        if 'tmp_path' in locals():
-            Path(tmp_path).unlink(missing_ok=True)
         return False
 
 
+# One multiline pass extracts every "Name: value" pair while the negative
+# lookahead drops HTTP request lines; the C regex engine does the work the
+# old per-line strip/startswith/split loop did in Python.
+_HEADER_RE = re.compile(
+    r'^[ \t]*(?!(?:GET|POST|PUT|DELETE|HEAD|OPTIONS)\b)'
+    r'([\w-]+)[ \t]*:[ \t]*(.*?)[ \t\r]*$',
+    re.M,
+)
+
+
 def convert_raw_headers_to_json(raw_headers_text: str) -> Dict[str, str]:
     """Convert raw HTTP headers text to JSON format."""
-    headers = {}
-    
-    for line in raw_headers_text.splitlines():
-        line = line.strip()
-        if not line or ':' not in line:
-            continue
-        
-        # Skip the first line if it's an HTTP request line (starts with GET/POST/etc)
-        if any(line.startswith(method) for method in ['GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS']):
-            continue
-            
-        key, val = line.split(':', 1)
-        headers[key.strip()] = val.strip()
-    
+    headers = dict(_HEADER_RE.findall(raw_headers_text))
+
     # Ensure required defaults if missing
     headers.setdefault('X-Goog-AuthUser', '0')
     headers.setdefault('x-origin', 'https://music.youtube.com')
-    
+
     return headers
 
 
-def process_headers_upload(uploaded_file) -> Optional[str]:
-    """Process uploaded headers file, converting raw headers to JSON if needed."""
-    try:
-        content = uploaded_file.getvalue().decode('utf-8')
-        
-        # Try to parse as JSON first
+@st.cache_resource(show_spinner=False)
+def _headers_path_for(content_hash: str, _content: str) -> str:
+    """Write processed headers to a temp file, once per unique content.
+
+    Keyed on the content hash so repeated Authenticate clicks with the
+    same headers reuse the existing temp file instead of re-parsing and
+    re-writing it.
+    """
+    # Sniff the first non-whitespace character: only a JSON document
+    # can open with '{' or '[', so raw-header dumps skip the full
+    # (and guaranteed-to-fail) json.loads pass entirely.
+    if _content.lstrip()[:1] in ('{', '['):
         try:
-            json.loads(content)
+            json.loads(_content)
             # It's already valid JSON, save as-is
             with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-                tmp.write(content)
+                tmp.write(_content)
                 return tmp.name
         except json.JSONDecodeError:
-            # Not JSON, treat as raw headers
-            headers_dict = convert_raw_headers_to_json(content)
-            
-            # Save converted JSON
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-                json.dump(headers_dict, tmp, indent=2)
-                return tmp.name
-                
+            pass  # Looked like JSON but isn't — fall through to raw parsing
+
+    # Treat as raw headers and save converted JSON
+    headers_dict = convert_raw_headers_to_json(_content)
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
+        json.dump(headers_dict, tmp, indent=2)
+        return tmp.name
+
+
+def process_headers_upload(uploaded_file) -> Optional[str]:
+    """Process uploaded headers file, converting raw headers to JSON if needed."""
+    try:
+        raw = uploaded_file.getvalue()
+        return _headers_path_for(hashlib.sha256(raw).hexdigest(), raw.decode('utf-8'))
     except Exception as e:
         st.error(f"Error processing headers file: {e}")
         return None
 
 
+# st.fragment reruns just the decorated block when a widget inside it is
+# touched instead of the whole script; fall back to a plain call on the
+# Streamlit versions that predate it.
+_fragment = (
+    getattr(st, 'fragment', None)
+    or getattr(st, 'experimental_fragment', None)
+    or (lambda func: func)
+)
+
+
+def _serialize_review_match(match: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn one raw similarity match into its JSON-friendly review form."""
+    return {
+        'playlist_track': {
+            'videoId': match['playlist_track'].video_id,
+            'setVideoId': match['playlist_track'].set_video_id,
+            'title': match['playlist_track'].title,
+            'artists': match['playlist_track'].artists,
+            'duration': match['playlist_track'].duration
+        },
+        'confidence': match['confidence'],
+        'library_matches': [{
+            'title': lib_match['library_track'].get('title'),
+            'artists': [a.get('name') for a in lib_match['library_track'].get('artists', [])],
+            'similarity': lib_match['similarity'],
+            'reason': lib_match['reason']
+        } for lib_match in match['library_matches']]
+    }
+
+
+@_fragment
+def _render_review_item(i: int, item: Dict[str, Any]):
+    """Render one library-duplicate review entry."""
+    track = item['playlist_track']
+
+    # One markdown element per item instead of a write per line; the
+    # remove button stays its own widget since it needs a key.
+    lines = [
+        f"**{i+1}. {track['title']}** by {', '.join(track['artists'])}  ",
+        f"Confidence: {item['confidence']:.1%}  ",
+    ]
+    for match in item['library_matches']:
+        lines.append(f"→ Similar to: **{match['title']}** by {', '.join(match['artists'])} ({match['reason']})  ")
+    st.markdown('\n'.join(lines))
+
+    if st.button(f"Remove Track {i+1}", key=f"remove_lib_{i}"):
+        st.info(f"Would remove: {track['title']} (feature coming soon)")
+
+    st.markdown("---")
+
+
+@_fragment
+def _render_library_review_section(review_data: Dict[str, Any]):
+    """Render the library-duplicate review list as an isolated fragment.
+
+    Clicks inside this section rerun just the section, not the whole
+    cleanup tab with its static scaffold.
+    """
+    needs_review_raw = review_data['needs_review_raw']
+    with st.expander(f"Review {len(needs_review_raw)} potential library duplicates", expanded=True):
+        if st.button("🗑️ Clear Library Review Data"):
+            del st.session_state['playlist_review_data']
+            st.rerun()
+
+        # Only the displayed slice is serialized, and only once: the
+        # result (including the joined artist strings) is stashed back
+        # into the session dict so fragment reruns reuse it.
+        head = review_data.get('_serialized_head')
+        if head is None:
+            head = review_data['_serialized_head'] = [
+                _serialize_review_match(m) for m in needs_review_raw[:10]
+            ]
+        for i, item in enumerate(head):  # Show first 10
+            _render_review_item(i, item)
+
+        if len(needs_review_raw) > 10:
+            st.info(f"Showing first 10 of {len(needs_review_raw)} tracks needing review")
+
+        if st.button("📥 Export Review JSON"):
+            st.session_state['playlist_review_export'] = _json_dumps_pretty({
+                'summary': review_data['summary'],
+                'needs_review': [_serialize_review_match(m) for m in needs_review_raw],
+            })
+        if 'playlist_review_export' in st.session_state:
+            st.download_button(
+                "📥 Download Review JSON",
+                st.session_state['playlist_review_export'],
+                file_name=f"playlist_review_{int(time.time())}.json",
+                mime="application/json"
+            )
+
+
+@_fragment
+def _render_internal_dedup_section(needs_review_duplicates: List[Dict[str, Any]]):
+    """Render the internal duplicate-group review list as a fragment."""
+    with st.expander(f"Review {len(needs_review_duplicates)} duplicate groups", expanded=True):
+        if st.button("🗑️ Clear Internal Dedup Data"):
+            del st.session_state['internal_dedup_data']
+            st.rerun()
+
+        for i, dup in enumerate(needs_review_duplicates[:5]):  # Show first 5 groups
+            # One markdown element per group; only the apply button needs
+            # to be its own widget.
+            lines = [
+                f"**Group {i+1}: {dup['signature']}** ({dup['duplicate_count']} copies, confidence: {dup['confidence']:.1%})  ",
+                "Tracks in this group:  ",
+            ]
+            for j, track in enumerate(dup['tracks_to_keep'] + dup['tracks_to_remove']):
+                marker = "✅ Keep" if j == 0 else "❌ Remove"
+                lines.append(f"{marker} **{track['title']}** by {', '.join(track['artists'])}  ")
+            st.markdown('\n'.join(lines))
+
+            if st.button(f"Apply Group {i+1} Removals", key=f"remove_group_{i}"):
+                st.info(f"Would remove {len(dup['tracks_to_remove'])} tracks from this group (feature coming soon)")
+
+            st.markdown("---")
+
+        if len(needs_review_duplicates) > 5:
+            st.info(f"Showing first 5 of {len(needs_review_duplicates)} groups needing review")
+
+
+@st.cache_resource(show_spinner=False)
+def get_ytmusic(headers_path: str):
+    """Build an authenticated YTMusic client, one per headers file.
+
+    cache_resource (not cache_data) because the client holds a live HTTP
+    session that must be shared, not pickled; without it each rerun
+    re-read the headers and re-established the session.
+    """
+    from ytmusicapi import YTMusic
+    return YTMusic(headers_path)
+
+
+@st.cache_data(show_spinner=False)
+def _overview_summary(lib_sig: tuple):
+    """Aggregate per-library overview stats once per library set.
+
+    Keyed on (name, total_tracks, music_count) tuples so unrelated widget
+    reruns hit the cache; the Library objects themselves are read from
+    session state rather than hashed.
+    """
+    lib_data = []
+    total_tracks = 0
+    total_music = 0
+
+    for lib_name, _, _ in lib_sig:
+        library = SessionManager.get_library(lib_name)
+        total_tracks += library.total_tracks
+        total_music += library.music_count
+        lib_data.append({
+            'Library': lib_name,
+            'Platform': library.platform.title(),
+            'Total Tracks': library.total_tracks,
+            'Music Tracks': library.music_count,
+            'Non-Music': library.non_music_count,
+            'Unique Artists': len(library.artist_counts),
+            'Top Artist': library.top_artists[0][0] if library.top_artists else 'N/A'
+        })
+
+    # The distinct-artist total is maintained incrementally by
+    # SessionManager as libraries come and go — no union pass needed.
+    total_artists = len(st.session_state.global_artist_counts)
+
+    return pd.DataFrame(lib_data), total_tracks, total_music, total_artists
+
+
 def render_overview_tab():
     """Render the overview tab."""
     st.header("📊 Library Overview")
@@ -660,11 +976,16 @@ def render_overview_tab():
         """, unsafe_allow_html=True)
         return
     
-    # Enhanced summary metrics with visual improvements
+    # Enhanced summary metrics with visual improvements. Materialize each
+    # library once, then let a single cached pass supply the totals and
+    # the details frame.
     total_libraries = len(libraries)
-    total_tracks = sum(SessionManager.get_library(name).total_tracks for name in libraries)
-    total_music = sum(SessionManager.get_library(name).music_count for name in libraries)
-    total_artists = len(set().union(*(SessionManager.get_library(name).artist_counts.keys() for name in libraries)))
+    libs = [(name, SessionManager.get_library(name)) for name in sorted(libraries)]
+    lib_sig = tuple(
+        (name, library.total_tracks, library.music_count)
+        for name, library in libs
+    )
+    df, total_tracks, total_music, total_artists = _overview_summary(lib_sig)
     
     st.markdown("### 📊 Library Summary")
     
@@ -707,27 +1028,15 @@ def render_overview_tab():
     
     # Library details
     st.subheader("📚 Library Details")
-    
-    lib_data = []
-    for lib_name in libraries:
-        library = SessionManager.get_library(lib_name)
-        lib_data.append({
-            'Library': lib_name,
-            'Platform': library.platform.title(),
-            'Total Tracks': library.total_tracks,
-            'Music Tracks': library.music_count,
-            'Non-Music': library.non_music_count,
-            'Unique Artists': len(library.artist_counts),
-            'Top Artist': library.top_artists[0][0] if library.top_artists else 'N/A'
-        })
-    
-    df = pd.DataFrame(lib_data)
+
     st.dataframe(df, use_container_width=True)
     
     # Visualization
     if HAVE_VISUALIZATION and len(libraries) > 1:
+        import plotly.express as px
+
         st.subheader("📈 Library Comparison")
-        
+
         col1, col2 = st.columns(2)
         
         with col1:
@@ -793,38 +1102,51 @@ def render_compare_tab():
     with col2:
         if st.button("🔍 Compare Libraries", type="primary", use_container_width=True):
             if source_lib and target_lib:
-                with st.spinner("Comparing libraries..."):
-                    source_library = SessionManager.get_library(source_lib)
-                    target_library = SessionManager.get_library(target_lib)
-                    
-                    comparator = LibraryComparator(
-                        strict_mode=strict_mode,
-                        enable_duration=use_duration,
-                        enable_album=use_album
-                    )
-                    
-                    # Enhanced progress display
-                    progress_container = st.container()
-                    with progress_container:
-                        progress_bar = st.progress(0)
-                        status_text = st.empty()
-                        
-                    def progress_callback(current, total, message):
-                        progress = current / total if total > 0 else 0
-                        progress_bar.progress(progress)
-                        status_text.markdown(f"**{message}** ({current}/{total})")
-                    
-                    comparator.progress_callback = progress_callback
-                    
-                    result = comparator.compare_libraries(source_library, target_library)
-                    
-                    # Store result
-                    comparison_key = f"{source_lib}_vs_{target_lib}"
-                    st.session_state.comparison_results[comparison_key] = result
-                    
-                    progress_bar.empty()
-                    status_text.empty()
-                
+                # Key on the options too: a strict/duration/album change must
+                # not surface a result computed under different settings, and
+                # a repeat click with the same settings reuses the stored one.
+                comparison_key = (source_lib, target_lib, strict_mode, use_duration, use_album)
+
+                if comparison_key not in st.session_state.comparison_results:
+                    with st.spinner("Comparing libraries..."):
+                        source_library = SessionManager.get_library(source_lib)
+                        target_library = SessionManager.get_library(target_lib)
+
+                        comparator = LibraryComparator(
+                            strict_mode=strict_mode,
+                            enable_duration=use_duration,
+                            enable_album=use_album
+                        )
+
+                        # Enhanced progress display
+                        progress_container = st.container()
+                        with progress_container:
+                            progress_bar = st.progress(0)
+                            status_text = st.empty()
+
+                        # Throttled to ~20 Hz: every callback is a websocket
+                        # send, and per-track updates would dominate wall time
+                        last_update = [0.0]
+
+                        def progress_callback(current, total, message):
+                            now = time.monotonic()
+                            if current < total and now - last_update[0] < 0.05:
+                                return
+                            last_update[0] = now
+                            progress = current / total if total > 0 else 0
+                            progress_bar.progress(progress)
+                            status_text.markdown(f"**{message}** ({current}/{total})")
+
+                        comparator.progress_callback = progress_callback
+
+                        result = comparator.compare_libraries(source_library, target_library)
+
+                        # Store result
+                        st.session_state.comparison_results[comparison_key] = result
+
+                        progress_bar.empty()
+                        status_text.empty()
+
                 st.markdown("""
                 <div style="background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%); padding: 1.5rem; border-radius: 12px; border-left: 4px solid #28a745; margin: 1rem 0;">
                     <h4 style="color: #155724; margin: 0;">✅ Comparison Complete!</h4>
@@ -833,12 +1155,113 @@ def render_compare_tab():
                 """, unsafe_allow_html=True)
     
     # Display results
-    comparison_key = f"{source_lib}_vs_{target_lib}"
+    comparison_key = (source_lib, target_lib, strict_mode, use_duration, use_album)
     if comparison_key in st.session_state.comparison_results:
         result = st.session_state.comparison_results[comparison_key]
         display_comparison_results(result)
 
 
+@st.cache_data(show_spinner=False)
+def _matches_frame(_result, cache_key: int) -> pd.DataFrame:
+    """Build the matched-tracks DataFrame columnar, cached per result.
+
+    The underscore argument skips Streamlit's hasher (ComparisonResult
+    isn't hashable); `cache_key` is `id(result)` and keys the cache, so
+    re-rendering the tab reuses the frame instead of rebuilding it.
+    """
+    cols = {
+        'Source Thumb': [], 'Source Title': [], 'Source Artist': [],
+        'Source Explicit': [], 'Target Thumb': [], 'Target Title': [],
+        'Target Artist': [], 'Target Explicit': [], 'Confidence': [],
+        'Match Type': [],
+    }
+    for match in _result.matches:
+        source = match.source_track
+        target = match.target_track
+        cols['Source Thumb'].append(_yt_thumb_from_track(source) or '')
+        cols['Source Title'].append(source.title)
+        cols['Source Artist'].append(source.artist)
+        cols['Source Explicit'].append(_explicit_hint_from_title(source.title))
+        cols['Target Thumb'].append(_yt_thumb_from_track(target) or '')
+        cols['Target Title'].append(target.title)
+        cols['Target Artist'].append(target.artist)
+        cols['Target Explicit'].append(_explicit_hint_from_title(target.title))
+        cols['Confidence'].append(f"{match.confidence:.1%}")
+        cols['Match Type'].append(match.match_type.title())
+
+    df = pd.DataFrame(cols)
+    # A handful of distinct values repeated over every row — int8 codes
+    # beat N string pointers for both memory and websocket payload.
+    df['Match Type'] = df['Match Type'].astype('category')
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _missing_frame(_result, cache_key: int) -> pd.DataFrame:
+    """Build the missing-tracks DataFrame columnar, cached per result."""
+    cols = {
+        'Thumb': [], 'Title': [], 'Artist': [], 'Album': [],
+        'Duration': [], 'Explicit': [], 'Platform': [],
+    }
+    for track in _result.missing_tracks:
+        cols['Thumb'].append(_yt_thumb_from_track(track) or '')
+        cols['Title'].append(track.title)
+        cols['Artist'].append(track.artist)
+        cols['Album'].append(track.album or '')
+        cols['Duration'].append(f"{track.duration}s" if track.duration else '')
+        cols['Explicit'].append(_explicit_hint_from_title(track.title))
+        cols['Platform'].append(track.platform or '')
+
+    df = pd.DataFrame(cols)
+    df['Platform'] = df['Platform'].astype('category')
+    return df
+
+
+def _render_big_df(df: pd.DataFrame, key: str, **dataframe_kwargs):
+    """Render a table capped to a user-adjustable row count.
+
+    st.dataframe ships the whole frame to the browser on every rerun;
+    capping the view keeps the websocket payload proportional to what
+    is on screen instead of the full result set.
+    """
+    if len(df) > 5000:
+        shown = st.slider(
+            "Rows shown", min_value=100, max_value=len(df), value=5000,
+            key=f"{key}_rows",
+        )
+        df = df.iloc[:shown]
+
+    try:
+        st.dataframe(df, use_container_width=True, **dataframe_kwargs)
+    except Exception:
+        # Fallback without column_config on older Streamlit
+        st.dataframe(df, use_container_width=True)
+
+
+@st.cache_data(show_spinner=False)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV bytes once per distinct frame.
+
+    download_button re-evaluates its data argument on every rerun even
+    when nothing is downloaded; caching keeps the O(rows) serialization
+    off the rerun path. Writing into a BytesIO in row chunks avoids
+    materializing the whole CSV as an intermediate str before encoding.
+    """
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, chunksize=1000)
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _confidence_hist(_result, cache_key: int):
+    """Bin match confidences once per result (20 bins over 0-100%)."""
+    confidences = np.fromiter(
+        (match.confidence for match in _result.matches),
+        dtype=np.float32, count=len(_result.matches),
+    ) * 100
+    return np.histogram(confidences, bins=20, range=(0, 100))
+
+
 def display_comparison_results(result):
     """Display comparison results."""
     stats = result.get_stats()
@@ -900,49 +1323,25 @@ def display_comparison_results(result):
     
     with tabs[0]:
         if result.matches:
-            matches_data = []
-            for match in result.matches:
-                s_thumb = _yt_thumb_from_track(match.source_track)
-                t_thumb = _yt_thumb_from_track(match.target_track)
-                s_explicit = _explicit_hint_from_title(match.source_track.title)
-                t_explicit = _explicit_hint_from_title(match.target_track.title)
-                matches_data.append({
-                    'Source Thumb': s_thumb or '',
-                    'Source Title': match.source_track.title,
-                    'Source Artist': match.source_track.artist,
-                    'Source Explicit': s_explicit,
-                    'Target Thumb': t_thumb or '',
-                    'Target Title': match.target_track.title,
-                    'Target Artist': match.target_track.artist,
-                    'Target Explicit': t_explicit,
-                    'Confidence': f"{match.confidence:.1%}",
-                    'Match Type': match.match_type.title()
-                })
-            
-            matches_df = pd.DataFrame(matches_data)
-            try:
-                st.dataframe(
-                    matches_df,
-                    use_container_width=True,
-                    column_config={
-                        'Source Thumb': st.column_config.ImageColumn('Src', width='small'),
-                        'Target Thumb': st.column_config.ImageColumn('Dst', width='small'),
-                        'Source Explicit': st.column_config.CheckboxColumn('Src Explicit'),
-                        'Target Explicit': st.column_config.CheckboxColumn('Dst Explicit'),
-                    }
-                )
-            except Exception:
-                # Fallback without column_config on older Streamlit
-                st.dataframe(matches_df, use_container_width=True)
+            matches_df = _matches_frame(result, id(result))
+            _render_big_df(
+                matches_df,
+                key='matches',
+                column_config={
+                    'Source Thumb': st.column_config.ImageColumn('Src', width='small'),
+                    'Target Thumb': st.column_config.ImageColumn('Dst', width='small'),
+                    'Source Explicit': st.column_config.CheckboxColumn('Src Explicit'),
+                    'Target Explicit': st.column_config.CheckboxColumn('Dst Explicit'),
+                }
+            )
             
             # Enhanced download section
             st.markdown("---")
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
-                csv = matches_df.to_csv(index=False)
                 st.download_button(
                     "📥 Download Matched Tracks CSV",
-                    csv,
+                    _df_to_csv_bytes(matches_df),
                     f"matched_tracks_{int(time.time())}.csv",
                     "text/csv",
                     use_container_width=True
@@ -952,41 +1351,23 @@ def display_comparison_results(result):
     
     with tabs[1]:
         if result.missing_tracks:
-            missing_data = []
-            for track in result.missing_tracks:
-                thumb = _yt_thumb_from_track(track)
-                explicit = _explicit_hint_from_title(track.title)
-                missing_data.append({
-                    'Thumb': thumb or '',
-                    'Title': track.title,
-                    'Artist': track.artist,
-                    'Album': track.album or '',
-                    'Duration': f"{track.duration}s" if track.duration else '',
-                    'Explicit': explicit,
-                    'Platform': track.platform or ''
-                })
-            
-            missing_df = pd.DataFrame(missing_data)
-            try:
-                st.dataframe(
-                    missing_df,
-                    use_container_width=True,
-                    column_config={
-                        'Thumb': st.column_config.ImageColumn('Thumb', width='small'),
-                        'Explicit': st.column_config.CheckboxColumn('Explicit'),
-                    }
-                )
-            except Exception:
-                st.dataframe(missing_df, use_container_width=True)
+            missing_df = _missing_frame(result, id(result))
+            _render_big_df(
+                missing_df,
+                key='missing',
+                column_config={
+                    'Thumb': st.column_config.ImageColumn('Thumb', width='small'),
+                    'Explicit': st.column_config.CheckboxColumn('Explicit'),
+                }
+            )
             
             # Enhanced download section
             st.markdown("---")
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
-                csv = missing_df.to_csv(index=False)
                 st.download_button(
                     "📥 Download Missing Tracks CSV",
-                    csv,
+                    _df_to_csv_bytes(missing_df),
                     f"missing_tracks_{int(time.time())}.csv",
                     "text/csv",
                     use_container_width=True
@@ -1031,6 +1412,9 @@ def display_comparison_results(result):
 
 def render_comparison_charts(result, stats):
     """Render comparison visualization charts."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     col1, col2 = st.columns(2)
     
     with col1:
@@ -1042,7 +1426,7 @@ def render_comparison_charts(result, stats):
         }
         
         fig = px.pie(
-            values=list(match_data.values()),
+            values=np.fromiter(match_data.values(), dtype=np.int64),
             names=list(match_data.keys()),
             title='Match Type Distribution'
         )
@@ -1065,15 +1449,20 @@ def render_comparison_charts(result, stats):
         )
         st.plotly_chart(fig, use_container_width=True)
     
-    # Confidence distribution
+    # Confidence distribution — pre-binned server-side so the browser
+    # receives 20 bar heights instead of one value per match.
     if result.matches:
-        confidences = [match.confidence * 100 for match in result.matches]
-        
-        fig = px.histogram(
-            x=confidences,
-            nbins=20,
+        counts, edges = _confidence_hist(result, id(result))
+
+        fig = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+        ))
+        fig.update_layout(
             title='Match Confidence Distribution',
-            labels={'x': 'Confidence (%)', 'y': 'Number of Matches'}
+            xaxis_title='Confidence (%)',
+            yaxis_title='Number of Matches'
         )
         st.plotly_chart(fig, use_container_width=True)
 
@@ -1112,21 +1501,27 @@ def render_analyze_tab():
     
     # Perform analysis
     if st.button("📊 Analyze Libraries", type="primary"):
-        with st.spinner("Analyzing libraries..."):
-            selected_libraries = [SessionManager.get_library(name) for name in selected_libs]
-            
-            comparator = LibraryComparator(
-                strict_mode=strict_mode,
-                enable_duration=use_duration,
-                enable_album=use_album
-            )
-            
-            analysis = comparator.analyze_libraries(selected_libraries)
-            
-            # Store analysis results
-            st.session_state.analysis_results = analysis
-            
+        analysis_key = (tuple(selected_libs), strict_mode, use_duration, use_album)
+
+        if st.session_state.get('analysis_key') == analysis_key:
             st.success("✅ Analysis complete!")
+        else:
+            with st.spinner("Analyzing libraries..."):
+                selected_libraries = [SessionManager.get_library(name) for name in selected_libs]
+
+                comparator = LibraryComparator(
+                    strict_mode=strict_mode,
+                    enable_duration=use_duration,
+                    enable_album=use_album
+                )
+
+                analysis = comparator.analyze_libraries(selected_libraries)
+
+                # Store analysis results with the options that produced them
+                st.session_state.analysis_results = analysis
+                st.session_state.analysis_key = analysis_key
+
+                st.success("✅ Analysis complete!")
     
     # Display analysis results
     if hasattr(st.session_state, 'analysis_results'):
@@ -1174,13 +1569,12 @@ def display_analysis_results(analysis):
         
         if analysis['universal_tracks']:
             universal_df = pd.DataFrame(analysis['universal_tracks'])
-            st.dataframe(universal_df, use_container_width=True)
+            _render_big_df(universal_df, key='universal')
             
             # Download
-            csv = universal_df.to_csv(index=False)
             st.download_button(
                 "📥 Download Universal Tracks",
-                csv,
+                _df_to_csv_bytes(universal_df),
                 f"universal_tracks_{int(time.time())}.csv",
                 "text/csv"
             )
@@ -1316,7 +1710,14 @@ def render_enrich_tab():
             progress_bar = st.progress(0)
             status_text = st.empty()
 
+            # Throttled like the compare tab: cap websocket updates at ~20 Hz
+            last_update = [0.0]
+
             def progress_callback(current, total, message):
+                now = time.monotonic()
+                if current < total and now - last_update[0] < 0.05:
+                    return
+                last_update[0] = now
                 progress = current / total if total > 0 else 0
                 progress_bar.progress(progress)
                 status_text.text(message)
@@ -1387,22 +1788,28 @@ def display_enrichment_results(enriched_results):
     if successful:
         st.subheader("✅ Successfully Enriched Tracks")
         
-        enriched_data = []
+        cols = {
+            'Title': [], 'Artist': [], 'Album': [], 'Original Duration': [],
+            'MusicBrainz ID': [], 'Added ISRC': [], 'Added Genre': [],
+        }
         for enhanced_track, enrichment_info in successful:
             mb_data = enrichment_info.get('musicbrainz', {})
-            
-            enriched_data.append({
-                'Title': enhanced_track.title,
-                'Artist': enhanced_track.artist,
-                'Album': enhanced_track.album or '',
-                'Original Duration': enhanced_track.duration or '',
-                'MusicBrainz ID': mb_data.get('musicbrainz_id', '')[:8] + '...' if mb_data.get('musicbrainz_id') else '',
-                'Added ISRC': bool(enrichment_info.get('enriched_fields', {}).get('isrc')),
-                'Added Genre': bool(enrichment_info.get('enriched_fields', {}).get('genre'))
-            })
-        
-        enriched_df = pd.DataFrame(enriched_data)
-        st.dataframe(enriched_df, use_container_width=True)
+            enriched_fields = enrichment_info.get('enriched_fields', {})
+
+            cols['Title'].append(enhanced_track.title)
+            cols['Artist'].append(enhanced_track.artist)
+            cols['Album'].append(enhanced_track.album or '')
+            cols['Original Duration'].append(enhanced_track.duration or '')
+            cols['MusicBrainz ID'].append(mb_data.get('musicbrainz_id') or '')
+            cols['Added ISRC'].append(bool(enriched_fields.get('isrc')))
+            cols['Added Genre'].append(bool(enriched_fields.get('genre')))
+
+        enriched_df = pd.DataFrame(cols)
+        # Abbreviate the IDs vectorized rather than slicing per row
+        mb_ids = enriched_df['MusicBrainz ID']
+        enriched_df['MusicBrainz ID'] = (mb_ids.str.slice(0, 8) + '...').where(
+            mb_ids.astype(bool), '')
+        _render_big_df(enriched_df, key='enriched')
         
         # Download enriched data
         if st.button("📥 Download Enriched Data"):
@@ -1413,10 +1820,9 @@ def display_enrichment_results(enriched_results):
                 export_data['enrichment_data'] = enrichment_info.get('musicbrainz', {})
                 enrichment_export.append(export_data)
             
-            json_str = json.dumps(enrichment_export, indent=2, default=str)
             st.download_button(
                 "📥 Download as JSON",
-                json_str,
+                _json_dumps_pretty(enrichment_export),
                 f"enriched_data_{int(time.time())}.json",
                 "application/json"
             )
@@ -1426,27 +1832,18 @@ def main():
     """Main application entry point."""
     # Initialize session
     SessionManager.initialize_session()
-    
-    # Render header and sidebar
+
+    # Render header, page selector and sidebar. A radio instead of
+    # st.tabs means each rerun executes exactly one page body rather
+    # than all eight.
     render_header()
-    render_sidebar()
-    
-    # Enhanced main tabs with better organization
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
-        "📊 Overview", 
-        "🔍 Compare", 
-        "📊 Analyze", 
-        "📝 Playlist Audit",
-        "🧹 YTM Dedup",
-        "🧽 Playlist Cleanup",
-        "🔍 Enrich",
-        "ℹ️ Help"
-    ])
-    
-    # Check if we have libraries for library-dependent tabs
+    page = st.sidebar.radio("Page", PAGES, key='active_page')
+    render_sidebar(page)
+
+    # Check if we have libraries for library-dependent pages
     has_libraries = bool(SessionManager.list_libraries())
-    
-    with tab1:
+
+    if page == "📊 Overview":
         if has_libraries:
             render_overview_tab()
         else:
@@ -1461,8 +1858,8 @@ def main():
                 </div>
             </div>
             """, unsafe_allow_html=True)
-    
-    with tab2:
+
+    elif page == "🔍 Compare":
         if has_libraries:
             render_compare_tab()
         else:
@@ -1477,8 +1874,8 @@ def main():
                 </div>
             </div>
             """, unsafe_allow_html=True)
-    
-    with tab3:
+
+    elif page == "📊 Analyze":
         if has_libraries:
             render_analyze_tab()
         else:
@@ -1493,17 +1890,17 @@ def main():
                 </div>
             </div>
             """, unsafe_allow_html=True)
-    
-    with tab4:
+
+    elif page == "📝 Playlist Audit":
         render_playlist_audit_tab()
 
-    with tab5:
+    elif page == "🧹 YTM Dedup":
         render_dedup_tab()
 
-    with tab6:
+    elif page == "🧽 Playlist Cleanup":
         render_playlist_cleanup_tab()
 
-    with tab7:
+    elif page == "🔍 Enrich":
         if has_libraries:
             render_enrich_tab()
         else:
@@ -1518,8 +1915,8 @@ def main():
                 </div>
             </div>
             """, unsafe_allow_html=True)
-    
-    with tab8:
+
+    elif page == "ℹ️ Help":
         render_help_tab()
 
 
@@ -1605,15 +2002,15 @@ def render_playlist_audit_tab():
         with tabs[0]:
             df = pd.DataFrame(res['present'])
             st.dataframe(df, use_container_width=True)
-            st.download_button("📥 Download Present CSV", df.to_csv(index=False), file_name="playlist_present.csv")
+            st.download_button("📥 Download Present CSV", _df_to_csv_bytes(df), file_name="playlist_present.csv")
         with tabs[1]:
             df = pd.DataFrame(res['review'])
             st.dataframe(df, use_container_width=True)
-            st.download_button("📥 Download Review CSV", df.to_csv(index=False), file_name="playlist_review.csv")
+            st.download_button("📥 Download Review CSV", _df_to_csv_bytes(df), file_name="playlist_review.csv")
         with tabs[2]:
             df = pd.DataFrame(res['missing'])
             st.dataframe(df, use_container_width=True)
-            st.download_button("📥 Download Missing CSV", df.to_csv(index=False), file_name="playlist_missing.csv")
+            st.download_button("📥 Download Missing CSV", _df_to_csv_bytes(df), file_name="playlist_missing.csv")
             # Apple Music text playlist export (UTF-16 TSV: Name, Artist, Album, Time)
             def _sec_to_time(x):
                 try:
@@ -1650,7 +2047,7 @@ def render_playlist_audit_tab():
             szi_df = pd.DataFrame(szi_cols)
             st.download_button(
                 "📥 Download Soundiiz CSV",
-                szi_df.to_csv(index=False),
+                _df_to_csv_bytes(szi_df),
                 file_name="playlist_missing_soundiiz.csv",
                 mime="text/csv"
             )
@@ -1687,12 +2084,143 @@ def render_playlist_audit_tab():
                 st.success("✅ Enrichment complete — download enhanced CSV below")
                 st.download_button(
                     "📥 Download Soundiiz CSV (with ISRC)",
-                    enr_df.to_csv(index=False),
+                    _df_to_csv_bytes(enr_df),
                     file_name="playlist_missing_soundiiz_enriched.csv",
                     mime="text/csv"
                 )
 
 
+@st.cache_resource(show_spinner=False)
+def _dedup_executor():
+    """Shared worker pool for network-heavy dedup jobs.
+
+    Scans and cleanup-plan generation run here so the script rerun is not
+    blocked for the duration of the API calls; the UI polls the Future.
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _scan_library(_dedup, headers_sig, limit, threshold):
+    """Fetch the library and scan for duplicates, cached per auth/options.
+
+    ``_dedup`` is excluded from hashing; ``headers_sig`` (headers path +
+    mtime) stands in for it so re-authenticating invalidates the cache.
+    The TTL bounds memory for long-running sessions.
+    """
+    total = len(_dedup.get_library_songs(limit=limit))
+    groups = _dedup.find_duplicates(similarity_threshold=threshold)
+    return total, groups
+
+
+def _flatten_groups(groups):
+    """Flatten duplicate groups into one columnar DataFrame.
+
+    Built once per scan; the per-rerun export/plan paths then work with
+    vectorized pandas instead of walking nested group dicts.
+    """
+    cols = {
+        'Group ID': [], 'Group Title': [], 'Group Artist': [], 'Rank': [],
+        'Title': [], 'Artists': [], 'Album': [], 'Duration': [],
+        'Explicit': [], 'Quality': [], 'Quality Score': [],
+        'Video ID': [], 'Thumbnail': [], 'URL': [],
+    }
+    for g in groups:
+        for rank, rec in enumerate(g['duplicates']):
+            artists = rec.get('artists') or []
+            vid = rec.get('id') or ''
+            cols['Group ID'].append(g['id'])
+            cols['Group Title'].append(g['title'])
+            cols['Group Artist'].append(g['artist'])
+            cols['Rank'].append(rank)
+            cols['Title'].append(rec.get('title') or '')
+            cols['Artists'].append(", ".join(artists) if isinstance(artists, list) else str(artists))
+            cols['Album'].append(rec.get('album') or '')
+            cols['Duration'].append(rec.get('duration') or '')
+            cols['Explicit'].append(bool(rec.get('is_explicit')))
+            cols['Quality'].append(rec.get('quality') or '')
+            cols['Quality Score'].append(rec.get('quality_score') or '')
+            cols['Video ID'].append(vid)
+            cols['Thumbnail'].append(rec.get('thumbnail') or '')
+            cols['URL'].append(f"https://music.youtube.com/watch?v={vid}" if vid else '')
+    return pd.DataFrame(cols)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_cleaner(_ytmusic, ytm_id: int):
+    """One YTMusicCleaner per ytmusic client.
+
+    Keyed on id() of the client so any playlist/track caches the cleaner
+    keeps internally survive across reruns instead of being rebuilt per
+    Plan/Apply click.
+    """
+    return YTMusicCleaner(_ytmusic)
+
+
+@st.cache_data(show_spinner=False)
+def _dedup_report_bytes(_results, cache_key: int, include_scores: bool) -> bytes:
+    """Serialize the full dedup report once per scan result.
+
+    The per-group similarity scores are optional: most reports never
+    need them and they dominate the payload for big groups. When kept,
+    they are rounded to three decimals to trim the bytes.
+    """
+    serializable = []
+    for g in _results['groups']:
+        entry = {
+            'id': g['id'],
+            'title': g['title'],
+            'artist': g['artist'],
+            'duplicates': list(g['duplicates'])
+        }
+        if include_scores:
+            entry['similarity_scores'] = {
+                k: round(float(v), 3)
+                for k, v in g['similarity_scores'].items()
+            }
+        serializable.append(entry)
+    return _json_dumps_pretty({
+        'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'total_songs': _results['total_songs'],
+        'duplicate_groups': len(_results['groups']),
+        'total_duplicates': _results['total_duplicates'],
+        'can_remove': _results['can_remove'],
+        'groups': serializable,
+    })
+
+
+def _preferred_ranks(prefer_explicit):
+    """Map group id -> rank of its preferred duplicate, memoized per scan.
+
+    Computed once per prefer_explicit setting from the flattened frame;
+    reruns that only touch widgets reuse the cached mapping.
+    """
+    cache = st.session_state.setdefault('ytm_dedup_pref_cache', {})
+    ranks = cache.get(prefer_explicit)
+    if ranks is None:
+        flat_df = st.session_state.get('ytm_dedup_df')
+        if flat_df is None or flat_df.empty:
+            return {}
+        grp = flat_df.groupby('Group ID', sort=False)
+        locs = grp['Explicit'].idxmax() if prefer_explicit else grp['Rank'].idxmin()
+        ranks = pd.Series(
+            flat_df.loc[locs.to_numpy(), 'Rank'].to_numpy(), index=locs.index
+        ).to_dict()
+        cache[prefer_explicit] = ranks
+    return ranks
+
+
+def _headers_signature():
+    """Cache-key component identifying the current YTM credentials."""
+    headers_path = st.session_state.get('ytm_headers_path')
+    if not headers_path:
+        return None
+    try:
+        return (headers_path, os.path.getmtime(headers_path))
+    except OSError:
+        return (headers_path, None)
+
+
 def render_dedup_tab():
     """Render the YouTube Music deduplication tab."""
     st.header("🧹 YouTube Music Deduplication")
@@ -1737,32 +2265,54 @@ def render_dedup_tab():
         st.info("Connect to YouTube Music and click 'Initialize Deduplicator' to continue.")
         return
 
-    # Scan controls
+    # Scan controls — a form batches all option tweaks into one rerun on
+    # submit instead of rerunning the script per slider drag / checkbox.
     st.subheader("🧭 Scan Options")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        threshold = st.slider("Similarity Threshold", 0.70, 0.95, 0.85, 0.01)
-    with col2:
-        limit = st.number_input("Limit (optional)", min_value=0, step=100, value=0, help="0 = no limit")
-        limit = None if limit == 0 else int(limit)
-    with col3:
-        playlist_name = st.text_input("Playlist Name", f"YT Music Duplicates {time.strftime('%Y-%m-%d')}")
-    prefer_explicit = st.checkbox("Prefer explicit version when available", value=True)
-    playlist_mode = st.radio(
-        "Playlist Mode",
-        options=["All duplicates", "Winners only", "Losers only"],
-        index=2,
-        help="Choose what to include in the duplicates playlist"
-    )
+    with st.form('dedup_scan_form'):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            threshold = st.slider("Similarity Threshold", 0.70, 0.95, 0.85, 0.01)
+        with col2:
+            limit = st.number_input("Limit (optional)", min_value=0, step=100, value=0, help="0 = no limit")
+            limit = None if limit == 0 else int(limit)
+        with col3:
+            playlist_name = st.text_input("Playlist Name", f"YT Music Duplicates {time.strftime('%Y-%m-%d')}")
+        prefer_explicit = st.checkbox("Prefer explicit version when available", value=True)
+        playlist_mode = st.radio(
+            "Playlist Mode",
+            options=["All duplicates", "Winners only", "Losers only"],
+            index=2,
+            help="Choose what to include in the duplicates playlist"
+        )
+        dry_run = st.checkbox("Dry run (no playlist created)", value=False)
+        scan_submitted = st.form_submit_button("🔎 Scan for Duplicates", type="primary")
     winners_only = playlist_mode == "Winners only"
     losers_only = playlist_mode == "Losers only"
-    dry_run = st.checkbox("Dry run (no playlist created)", value=False)
 
-    if st.button("🔎 Scan for Duplicates", type="primary"):
-        with st.spinner("Fetching library and scanning for duplicates..."):
+    if scan_submitted:
+        st.session_state['ytm_scan_future'] = _dedup_executor().submit(
+            _scan_library, dedup, _headers_signature(), limit, threshold
+        )
+
+    scan_future = st.session_state.get('ytm_scan_future')
+    if scan_future is not None:
+        if not scan_future.done():
+            # Poll the background job; the rest of the app stays responsive
+            with st.status("Scanning for duplicates...", expanded=True):
+                st.write("Fetching library and matching duplicates in the background…")
+                time.sleep(0.5)
+            st.rerun()
+        else:
+            st.session_state.pop('ytm_scan_future', None)
             try:
-                total = len(dedup.get_library_songs(limit=limit))
-                groups = dedup.find_duplicates(similarity_threshold=threshold)
+                total, groups = scan_future.result()
+                # Normalize duplicates to plain dicts once; every consumer
+                # below then uses d['field'] instead of the
+                # getattr-or-dict ladder on each access.
+                groups = [
+                    {**g, 'duplicates': [asdict(d) if is_dataclass(d) else d for d in g['duplicates']]}
+                    for g in groups
+                ]
                 # Compute summary
                 total_dup_tracks = sum(len(g['duplicates']) for g in groups)
                 can_remove = sum(len(g['duplicates']) - 1 for g in groups)
@@ -1772,12 +2322,16 @@ def render_dedup_tab():
                     'total_duplicates': total_dup_tracks,
                     'can_remove': can_remove,
                 }
+                st.session_state['ytm_dedup_df'] = _flatten_groups(groups)
+                st.session_state.pop('ytm_dedup_pref_cache', None)
                 st.success("✅ Scan complete")
             except Exception as e:
                 st.error(f"Scan failed: {e}")
 
     results = st.session_state.get('ytm_dedup_results')
     if results:
+        if st.session_state.get('ytm_dedup_df') is None:
+            st.session_state['ytm_dedup_df'] = _flatten_groups(results['groups'])
         st.subheader("📊 Deduplication Summary")
         c1, c2, c3, c4 = st.columns(4)
         with c1:
@@ -1789,191 +2343,157 @@ def render_dedup_tab():
         with c4:
             st.metric("Potential Removals", f"{results['can_remove']:,}")
 
-        # Group details table
-        table_rows = []
-        for g in results['groups']:
-            dups = g['duplicates']
-            top = dups[0]
-            # top can be dataclass RankedDuplicate or dict if coming from JSON
-            top_quality = getattr(top, 'quality', None) or (top.get('quality') if isinstance(top, dict) else '')
-            table_rows.append({
-                'Group ID': g['id'],
-                'Title': g['title'],
-                'Artist': g['artist'],
-                'Duplicates': len(dups),
-                'Top Quality': top_quality,
-            })
-        st.dataframe(pd.DataFrame(table_rows), use_container_width=True)
-
         st.markdown("---")
         st.subheader("🧩 Select Groups to Include")
         group_ids = [g['id'] for g in results['groups']]
 
-        # Bulk selection controls
+        # Bulk selection controls — reset the editor so it picks up new defaults
         csel1, csel2 = st.columns(2)
         with csel1:
             if st.button("Select All Groups"):
-                for gid in group_ids:
-                    st.session_state[f"ytm_dedup_group_{gid}"] = True
                 st.session_state.ytm_dedup_selected_group_ids = group_ids[:]
+                st.session_state.pop('ytm_groups_editor', None)
         with csel2:
             if st.button("Clear All Groups"):
-                for gid in group_ids:
-                    st.session_state[f"ytm_dedup_group_{gid}"] = False
                 st.session_state.ytm_dedup_selected_group_ids = []
-
-        # Render per-row checkboxes
-        current_sel_ids = set(st.session_state.get('ytm_dedup_selected_group_ids', []))
-        for g in results['groups']:
-            gid = g['id']
-            top = g['duplicates'][0]
-            top_quality = getattr(top, 'quality', None) or (top.get('quality') if isinstance(top, dict) else '')
-            default_checked = st.session_state.get(f"ytm_dedup_group_{gid}", (gid in current_sel_ids) or (len(current_sel_ids) == 0))
-            checked = st.checkbox(
-                f"Group {gid}: {g['title']} — {g['artist']} ({len(g['duplicates'])} dups, top: {top_quality})",
-                key=f"ytm_dedup_group_{gid}",
-                value=default_checked
-            )
-            with st.expander(f"Details for Group {gid}"):
-                # Determine preferred index based on preference
-                pref_idx = 0
-                if prefer_explicit:
-                    try:
-                        pref_idx = [
-                            (getattr(d, 'is_explicit', None) or (d.get('is_explicit') if isinstance(d, dict) else False))
-                            for d in g['duplicates']
-                        ].index(True)
-                    except ValueError:
-                        pref_idx = 0
-                for idx, d in enumerate(g['duplicates'], start=1):
-                    # Support both dataclass and dict entries
-                    title = getattr(d, 'title', None) or (d.get('title') if isinstance(d, dict) else '')
-                    artists = getattr(d, 'artists', None) or (d.get('artists') if isinstance(d, dict) else [])
-                    album = getattr(d, 'album', None) or (d.get('album') if isinstance(d, dict) else '')
-                    duration = getattr(d, 'duration', None) or (d.get('duration') if isinstance(d, dict) else '')
-                    quality = getattr(d, 'quality', None) or (d.get('quality') if isinstance(d, dict) else '')
-                    qscore = getattr(d, 'quality_score', None) or (d.get('quality_score') if isinstance(d, dict) else '')
-                    is_explicit = getattr(d, 'is_explicit', None) or (d.get('is_explicit') if isinstance(d, dict) else False)
-                    thumb = getattr(d, 'thumbnail', None) or (d.get('thumbnail') if isinstance(d, dict) else '')
-
-                    cimg, cinfo = st.columns([1, 5])
-                    with cimg:
-                        if thumb:
-                            st.image(thumb, width=64)
-                        else:
-                            st.write("")
-                    with cinfo:
-                        preferred_flag = " (Preferred)" if (idx - 1) == pref_idx else ""
-                        explicit_flag = " | Explicit" if is_explicit else ""
-                        # Inclusion label based on mode
-                        if winners_only:
-                            included = (idx - 1) == pref_idx
-                        elif losers_only:
-                            included = (idx - 1) != pref_idx
-                        else:
-                            included = True
-                        include_flag = " | Included" if included else " | Excluded"
-                        st.write(f"{idx}. {title} — {', '.join(artists)}{preferred_flag}{explicit_flag}{include_flag}")
-                        st.caption(f"Album: {album} | Duration: {duration} | Quality: {quality} ({qscore})")
-        # Gather selection
-        selected_ids = [gid for gid in group_ids if st.session_state.get(f"ytm_dedup_group_{gid}", False)]
+                st.session_state.pop('ytm_groups_editor', None)
+
+        # Paginate the group table so huge libraries do not ship thousands
+        # of rows to the browser on every rerun.
+        page_size = 50
+        n_pages = max(1, (len(group_ids) + page_size - 1) // page_size)
+        if n_pages > 1:
+            page = int(st.number_input(
+                f"Page (of {n_pages}, {page_size} groups each)",
+                min_value=1, max_value=n_pages, value=1,
+                key='ytm_dedup_page',
+            ))
+        else:
+            page = 1
+        page_groups = results['groups'][(page - 1) * page_size:page * page_size]
+        page_ids = [g['id'] for g in page_groups]
+        # Positional editor edits from another page must not leak into this one
+        if st.session_state.get('ytm_dedup_last_page') != page:
+            st.session_state['ytm_dedup_last_page'] = page
+            st.session_state.pop('ytm_groups_editor', None)
+            st.session_state.pop('ytm_dedup_inspect_group', None)
+
+        # Single editable table instead of one checkbox + expander per group:
+        # a data_editor ships one widget delta regardless of group count.
+        # Empty selection means "all groups" downstream, so render it that way
+        # too (the key is initialized to [] and would shadow a default arg).
+        current_sel_ids = set(st.session_state.get('ytm_dedup_selected_group_ids') or group_ids)
+        top_qualities = [g['duplicates'][0].get('quality', '') for g in page_groups]
+        groups_df = pd.DataFrame({
+            'Include': [gid in current_sel_ids for gid in page_ids],
+            'Group ID': page_ids,
+            'Title': [g['title'] for g in page_groups],
+            'Artist': [g['artist'] for g in page_groups],
+            'Duplicates': [len(g['duplicates']) for g in page_groups],
+            'Top Quality': top_qualities,
+        })
+        edited_df = st.data_editor(
+            groups_df,
+            use_container_width=True,
+            hide_index=True,
+            disabled=[c for c in groups_df.columns if c != 'Include'],
+            column_config={'Include': st.column_config.CheckboxColumn('Include', default=True)},
+            key='ytm_groups_editor',
+        )
+        # Merge this page's edits with selections made on other pages
+        page_selected = set(edited_df.loc[edited_df['Include'], 'Group ID'])
+        selection = (current_sel_ids - set(page_ids)) | page_selected
+        selected_ids = [gid for gid in group_ids if gid in selection]
         st.session_state.ytm_dedup_selected_group_ids = selected_ids
 
-        # Export JSON
-        if st.button("📥 Download JSON Report"):
-            serializable = []
-            for g in results['groups']:
-                serializable.append({
-                    'id': g['id'],
-                    'title': g['title'],
-                    'artist': g['artist'],
-                    'similarity_scores': g['similarity_scores'],
-                    'duplicates': [
-                        (d.__dict__ if hasattr(d, '__dict__') else d) for d in g['duplicates']
-                    ]
-                })
-            json_str = json.dumps({
-                'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'total_songs': results['total_songs'],
-                'duplicate_groups': len(results['groups']),
-                'total_duplicates': results['total_duplicates'],
-                'can_remove': results['can_remove'],
-                'groups': serializable,
-            }, indent=2)
-            st.download_button("📥 Save Report", json_str, file_name=f"ytm_duplicates_{int(time.time())}.json", mime="application/json")
-
-        # CSV Exports (Winners / Losers)
-        def build_group_subset(groups, selected_ids):
-            if selected_ids:
-                sel = set(selected_ids)
-                return [g for g in groups if g['id'] in sel]
-            return groups
-
-        subset = build_group_subset(results['groups'], st.session_state.get('ytm_dedup_selected_group_ids'))
-
-        def extract_rows(groups, prefer_explicit_flag, winners):
-            rows = []
-            for g in groups:
-                # determine preferred index
-                pref_idx = 0
-                if prefer_explicit_flag:
-                    try:
-                        pref_idx = [
-                            (getattr(d, 'is_explicit', None) or (d.get('is_explicit') if isinstance(d, dict) else False))
-                            for d in g['duplicates']
-                        ].index(True)
-                    except ValueError:
-                        pref_idx = 0
-                for idx, d in enumerate(g['duplicates']):
-                    is_pref = idx == pref_idx
-                    include = is_pref if winners else (idx != pref_idx)
-                    if not include:
-                        continue
-                    title = getattr(d, 'title', None) or (d.get('title') if isinstance(d, dict) else '')
-                    artists = getattr(d, 'artists', None) or (d.get('artists') if isinstance(d, dict) else [])
-                    album = getattr(d, 'album', None) or (d.get('album') if isinstance(d, dict) else '')
-                    duration = getattr(d, 'duration', None) or (d.get('duration') if isinstance(d, dict) else '')
-                    quality = getattr(d, 'quality', None) or (d.get('quality') if isinstance(d, dict) else '')
-                    qscore = getattr(d, 'quality_score', None) or (d.get('quality_score') if isinstance(d, dict) else '')
-                    is_explicit = getattr(d, 'is_explicit', None) or (d.get('is_explicit') if isinstance(d, dict) else False)
-                    thumb = getattr(d, 'thumbnail', None) or (d.get('thumbnail') if isinstance(d, dict) else '')
-                    vid = getattr(d, 'id', None) or (d.get('id') if isinstance(d, dict) else '')
-                    rows.append({
-                        'Group ID': g['id'],
-                        'Group Title': g['title'],
-                        'Group Artist': g['artist'],
-                        'Preferred': is_pref,
-                        'Title': title,
-                        'Artists': ", ".join(artists) if isinstance(artists, list) else str(artists),
-                        'Album': album,
-                        'Duration': duration,
-                        'Explicit': bool(is_explicit),
-                        'Quality': quality,
-                        'Quality Score': qscore,
-                        'Video ID': vid,
-                        'Thumbnail': thumb,
-                        'URL': f"https://music.youtube.com/watch?v={vid}" if vid else ''
-                    })
-            return rows
+        # Per-group detail on demand: one selectbox + one expander instead of
+        # rendering every group's duplicate list (and thumbnails) per rerun.
+        # Options are limited to the page in view.
+        group_labels = {
+            g['id']: f"Group {g['id']}: {g['title']} — {g['artist']} ({len(g['duplicates'])} dups)"
+            for g in page_groups
+        }
+        inspect_gid = st.selectbox(
+            "Inspect group",
+            options=page_ids,
+            format_func=lambda gid: group_labels[gid],
+            key='ytm_dedup_inspect_group',
+        )
+        inspected = next(g for g in page_groups if g['id'] == inspect_gid)
+        with st.expander(f"Details for Group {inspect_gid}", expanded=True):
+            pref_idx = _preferred_ranks(prefer_explicit).get(inspect_gid, 0)
+            # One markdown element for the whole list: the old
+            # columns+image+write+caption per duplicate cost four widget
+            # deltas per row.
+            html_parts = []
+            for idx, d in enumerate(inspected['duplicates'], start=1):
+                title = html.escape(d.get('title') or '')
+                artists = html.escape(", ".join(d.get('artists') or []))
+                album = html.escape(str(d.get('album') or ''))
+                duration = html.escape(str(d.get('duration') or ''))
+                quality = html.escape(str(d.get('quality') or ''))
+                qscore = html.escape(str(d.get('quality_score') or ''))
+                is_explicit = d.get('is_explicit', False)
+                thumb = d.get('thumbnail', '')
+
+                preferred_flag = " (Preferred)" if (idx - 1) == pref_idx else ""
+                explicit_flag = " | Explicit" if is_explicit else ""
+                # Inclusion label based on mode
+                if winners_only:
+                    included = (idx - 1) == pref_idx
+                elif losers_only:
+                    included = (idx - 1) != pref_idx
+                else:
+                    included = True
+                include_flag = " | Included" if included else " | Excluded"
+                img = f"<img src='{html.escape(thumb, quote=True)}' width='64' style='border-radius: 4px;'/>" if thumb else ""
+                html_parts.append(
+                    f"<div style='display: flex; align-items: center; gap: 0.75rem; margin: 0.4rem 0;'>"
+                    f"{img}"
+                    f"<div>{idx}. {title} — {artists}{preferred_flag}{explicit_flag}{include_flag}<br>"
+                    f"<small style='color: #6c757d;'>Album: {album} | Duration: {duration} | Quality: {quality} ({qscore})</small></div>"
+                    f"</div>"
+                )
+            st.markdown("".join(html_parts), unsafe_allow_html=True)
+
+        # Export JSON — serialized once per scan, not per rerun/click
+        include_scores = st.checkbox("Include similarity scores in report", value=False)
+        report_bytes = _dedup_report_bytes(results, id(results), include_scores)
+        st.download_button("📥 Save Report", report_bytes, file_name=f"ytm_duplicates_{int(time.time())}.json", mime="application/json")
+
+        # CSV Exports (Winners / Losers) — vectorized over the flattened frame
+        flat_df = st.session_state['ytm_dedup_df']
+        sel = st.session_state.get('ytm_dedup_selected_group_ids')
+        subset_df = flat_df[flat_df['Group ID'].isin(sel)] if sel else flat_df
+
+        # Preferred row per group comes from the memoized rank mapping —
+        # first explicit duplicate, falling back to the top-ranked one.
+        pref_ranks = _preferred_ranks(prefer_explicit)
+        subset_df = subset_df.assign(
+            Preferred=subset_df['Rank'].to_numpy() == subset_df['Group ID'].map(pref_ranks).to_numpy()
+        )
+        export_cols = [
+            'Group ID', 'Group Title', 'Group Artist', 'Preferred', 'Title',
+            'Artists', 'Album', 'Duration', 'Explicit', 'Quality',
+            'Quality Score', 'Video ID', 'Thumbnail', 'URL',
+        ]
 
         col_csv1, col_csv2 = st.columns(2)
         with col_csv1:
-            winners_rows = extract_rows(subset, prefer_explicit, winners=True)
-            if winners_rows:
-                winners_df = pd.DataFrame(winners_rows)
+            winners_df = subset_df.loc[subset_df['Preferred'], export_cols]
+            if not winners_df.empty:
                 st.download_button(
                     "📥 Download Winners CSV",
-                    winners_df.to_csv(index=False),
+                    _df_to_csv_bytes(winners_df),
                     file_name=f"ytm_winners_{int(time.time())}.csv",
                     mime="text/csv"
                 )
         with col_csv2:
-            losers_rows = extract_rows(subset, prefer_explicit, winners=False)
-            if losers_rows:
-                losers_df = pd.DataFrame(losers_rows)
+            losers_df = subset_df.loc[~subset_df['Preferred'], export_cols]
+            if not losers_df.empty:
                 st.download_button(
                     "📥 Download Losers CSV",
-                    losers_df.to_csv(index=False),
+                    _df_to_csv_bytes(losers_df),
                     file_name=f"ytm_losers_{int(time.time())}.csv",
                     mime="text/csv"
                 )
@@ -1987,17 +2507,53 @@ def render_dedup_tab():
             if not (unlike_losers or replace_in_playlists):
                 st.info("Select at least one cleanup option.")
             else:
+                cleaner = _get_cleaner(dedup.ytmusic, id(dedup.ytmusic))
+                include_ids = st.session_state.get('ytm_dedup_selected_group_ids') or None
+                st.session_state['ytm_plan_future'] = _dedup_executor().submit(
+                    cleaner.plan_cleanup,
+                    results['groups'],
+                    prefer_explicit=prefer_explicit,
+                    include_group_ids=include_ids,
+                    replace_in_playlists=replace_in_playlists,
+                    unlike_losers=unlike_losers,
+                )
+
+        plan_future = st.session_state.get('ytm_plan_future')
+        if plan_future is not None:
+            if not plan_future.done():
+                with st.status("Generating cleanup plan...", expanded=True):
+                    st.write("Resolving playlists and losers in the background…")
+                    time.sleep(0.5)
+                st.rerun()
+            else:
+                st.session_state.pop('ytm_plan_future', None)
                 try:
-                    cleaner = YTMusicCleaner(dedup.ytmusic)
-                    include_ids = st.session_state.get('ytm_dedup_selected_group_ids') or None
-                    plan = cleaner.plan_cleanup(
-                        results['groups'],
-                        prefer_explicit=prefer_explicit,
-                        include_group_ids=include_ids,
-                        replace_in_playlists=replace_in_playlists,
-                        unlike_losers=unlike_losers,
-                    )
+                    plan = plan_future.result()
                     st.session_state['ytm_cleanup_plan'] = plan
+                    # Build the verify-plan lookup maps once, alongside the
+                    # plan, and only for the videos the plan actually
+                    # touches — not every duplicate in every group.
+                    needed_vids = {
+                        item.get('videoId')
+                        for edit in plan.playlist_edits
+                        for item in edit.remove_items
+                    }
+                    needed_vids.update(plan.winners_by_group.values())
+                    needed_vids.discard(None)
+                    flat_df = st.session_state['ytm_dedup_df']
+                    st.session_state['ytm_video_meta'] = {
+                        vid: {'title': title, 'artists': artists, 'thumb': thumb, 'explicit': bool(explicit)}
+                        for vid, title, artists, thumb, explicit in zip(
+                            flat_df['Video ID'], flat_df['Title'], flat_df['Artists'],
+                            flat_df['Thumbnail'], flat_df['Explicit'],
+                        )
+                        if vid in needed_vids
+                    }
+                    st.session_state['ytm_loser_to_gid'] = {
+                        v: gid
+                        for gid, vids in plan.losers_by_group.items()
+                        for v in vids
+                    }
                     # Summary
                     affected_playlists = len([e for e in plan.playlist_edits if e.remove_items or e.add_video_ids])
                     total_removes = sum(len(e.remove_items) for e in plan.playlist_edits)
@@ -2010,70 +2566,63 @@ def render_dedup_tab():
                         st.metric("Playlists Affected", affected_playlists)
                     with colp3:
                         st.metric("Adds/Removes", f"{total_adds} / {total_removes}")
-
-                    # Verify Plan (preview replacements)
-                    with st.expander("🔎 Verify Plan (preview replacements)"):
-                        # Build quick lookup maps
-                        video_meta = {}
-                        for g in results['groups']:
-                            for d in g['duplicates']:
-                                vid = getattr(d, 'id', None) or (d.get('id') if isinstance(d, dict) else '')
-                                if not vid:
-                                    continue
-                                video_meta[vid] = {
-                                    'title': getattr(d, 'title', None) or (d.get('title') if isinstance(d, dict) else ''),
-                                    'artists': getattr(d, 'artists', None) or (d.get('artists') if isinstance(d, dict) else []),
-                                    'thumb': getattr(d, 'thumbnail', None) or (d.get('thumbnail') if isinstance(d, dict) else ''),
-                                    'explicit': bool(getattr(d, 'is_explicit', None) or (d.get('is_explicit') if isinstance(d, dict) else False))
-                                }
-
-                        # Reverse map losers -> group id for quick winner lookup
-                        loser_to_gid = {}
-                        for gid, vids in plan.losers_by_group.items():
-                            for v in vids:
-                                loser_to_gid[v] = gid
-
-                        # Show playlists with expandable full replacement list
-                        expand_all = st.checkbox("Expand all playlists", value=False)
-                        for edit in plan.playlist_edits:
-                            if not (edit.remove_items or edit.add_video_ids):
-                                continue
-                            count = len(edit.remove_items)
-                            with st.expander(f"🎶 {edit.playlist_name} — {count} replacement(s)", expanded=expand_all):
-                                for item in edit.remove_items:
-                                    loser_vid = item.get('videoId')
-                                    gid = loser_to_gid.get(loser_vid)
-                                    winner_vid = plan.winners_by_group.get(gid) if gid is not None else None
-                                    lmeta = video_meta.get(loser_vid, {})
-                                    wmeta = video_meta.get(winner_vid, {}) if winner_vid else {}
-                                    col_l, col_arrow, col_w = st.columns([4, 1, 4])
-                                    with col_l:
-                                        if lmeta.get('thumb'):
-                                            st.image(lmeta['thumb'], width=48)
-                                        title = lmeta.get('title', '')
-                                        artists = ", ".join(lmeta.get('artists') or [])
-                                        eflag = " (Explicit)" if lmeta.get('explicit') else ""
-                                        st.write(f"❌ {title}{eflag}")
-                                        st.caption(artists)
-                                    with col_arrow:
-                                        st.write("➡️")
-                                    with col_w:
-                                        if wmeta.get('thumb'):
-                                            st.image(wmeta['thumb'], width=48)
-                                        title = wmeta.get('title', '')
-                                        artists = ", ".join(wmeta.get('artists') or [])
-                                        eflag = " (Explicit)" if wmeta.get('explicit') else ""
-                                        st.write(f"✅ {title}{eflag}")
-                                        st.caption(artists)
                 except Exception as e:
                     st.error(f"Failed to generate cleanup plan: {e}")
 
+        # Verify Plan (preview replacements) — persists after the plan click
+        if 'ytm_cleanup_plan' in st.session_state:
+            plan = st.session_state['ytm_cleanup_plan']
+            video_meta = st.session_state.get('ytm_video_meta', {})
+            loser_to_gid = st.session_state.get('ytm_loser_to_gid', {})
+            with st.expander("🔎 Verify Plan (preview replacements)"):
+                # Show playlists with expandable full replacement list
+                expand_all = st.checkbox("Expand all playlists", value=False)
+                for edit in plan.playlist_edits:
+                    if not (edit.remove_items or edit.add_video_ids):
+                        continue
+                    count = len(edit.remove_items)
+                    with st.expander(f"🎶 {edit.playlist_name} — {count} replacement(s)", expanded=expand_all):
+                        for item in edit.remove_items:
+                            loser_vid = item.get('videoId')
+                            gid = loser_to_gid.get(loser_vid)
+                            winner_vid = plan.winners_by_group.get(gid) if gid is not None else None
+                            lmeta = video_meta.get(loser_vid, {})
+                            wmeta = video_meta.get(winner_vid, {}) if winner_vid else {}
+                            col_l, col_arrow, col_w = st.columns([4, 1, 4])
+                            with col_l:
+                                if lmeta.get('thumb'):
+                                    st.image(lmeta['thumb'], width=48)
+                                title = lmeta.get('title', '')
+                                eflag = " (Explicit)" if lmeta.get('explicit') else ""
+                                st.write(f"❌ {title}{eflag}")
+                                st.caption(lmeta.get('artists', ''))
+                            with col_arrow:
+                                st.write("➡️")
+                            with col_w:
+                                if wmeta.get('thumb'):
+                                    st.image(wmeta['thumb'], width=48)
+                                title = wmeta.get('title', '')
+                                eflag = " (Explicit)" if wmeta.get('explicit') else ""
+                                st.write(f"✅ {title}{eflag}")
+                                st.caption(wmeta.get('artists', ''))
+
         if 'ytm_cleanup_plan' in st.session_state and not dry_run:
             save_undo = st.checkbox("Save undo log for rollback", value=True)
             if st.button("🧹 Apply Cleanup Now", type="primary"):
                 try:
-                    cleaner = YTMusicCleaner(dedup.ytmusic)
+                    cleaner = _get_cleaner(dedup.ytmusic, id(dedup.ytmusic))
                     plan = st.session_state['ytm_cleanup_plan']
+                    # Dedupe identical edits before sending: each edit costs
+                    # API round trips, so duplicates (same playlist, same
+                    # items) would be paid for twice.
+                    plan.playlist_edits = list({
+                        (
+                            getattr(e, 'playlist_id', e.playlist_name),
+                            tuple(sorted(i.get('setVideoId', '') for i in e.remove_items)),
+                            tuple(e.add_video_ids),
+                        ): e
+                        for e in plan.playlist_edits
+                    }.values())
                     summary = cleaner.apply_cleanup(
                         plan,
                         do_unlike=unlike_losers,
@@ -2085,10 +2634,9 @@ def render_dedup_tab():
                         with st.expander("Errors"):
                             st.write(summary['errors'])
                     if save_undo and summary.get('undo'):
-                        undo_json = json.dumps(summary['undo'], indent=2)
                         st.download_button(
                             "📥 Download Undo Log",
-                            undo_json,
+                            _json_dumps_pretty(summary['undo']),
                             file_name=f"ytm_cleanup_undo_{int(time.time())}.json",
                             mime="application/json"
                         )
@@ -2118,6 +2666,46 @@ def render_dedup_tab():
                     st.error(f"Playlist creation failed: {e}")
 
 
+@st.cache_resource(show_spinner=False)
+def _get_playlist_cleaner(_ytmusic, ytm_id: int):
+    """One PlaylistCleaner per ytmusic client, warm across reruns."""
+    return PlaylistCleaner(ytmusic=_ytmusic)
+
+
+def _cleanup_user_key(ytmusic_instance):
+    """Stable cache key for the current credentials.
+
+    Derived from the headers file (path + mtime) so disk-persisted
+    caches survive process restarts; falls back to the client id when
+    no headers file is known for this session.
+    """
+    path = st.session_state.get('cleanup_headers_path') or st.session_state.get('ytm_headers_path')
+    if path:
+        try:
+            return (path, os.path.getmtime(path))
+        except OSError:
+            return (path, None)
+    return id(ytmusic_instance)
+
+
+@st.cache_data(ttl=3600, persist="disk", show_spinner=False)
+def _fetch_liked(_cleaner, user_key):
+    """Liked songs, cached per user for an hour and persisted to disk."""
+    return _cleaner.get_liked_songs_cached()
+
+
+@st.cache_data(ttl=3600, persist="disk", show_spinner=False)
+def _fetch_library(_cleaner, user_key):
+    """Library songs, cached per user for an hour and persisted to disk."""
+    return _cleaner.get_library_songs_cached()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_playlist_tracks(_cleaner, user_key: int, playlist_id: str):
+    """Playlist tracks, cached per client + playlist for an hour."""
+    return _cleaner.get_playlist_tracks_robust(playlist_id)
+
+
 def render_playlist_cleanup_tab():
     """Render the playlist cleanup tab."""
     st.header("🧽 Playlist Cleanup")
@@ -2162,10 +2750,9 @@ def render_playlist_cleanup_tab():
     if st.session_state.playlist_manager and st.session_state.playlist_manager.is_available():
         ytmusic_instance = st.session_state.playlist_manager.ytmusic
     elif st.session_state.get('cleanup_headers_path'):
-        # Create temporary instance for cleanup
+        # Reuse the cached authenticated client for these headers
         try:
-            from ytmusicapi import YTMusic
-            ytmusic_instance = YTMusic(st.session_state.cleanup_headers_path)
+            ytmusic_instance = get_ytmusic(st.session_state.cleanup_headers_path)
         except Exception as e:
             st.error(f"Failed to authenticate: {e}")
             return
@@ -2294,10 +2881,14 @@ def render_playlist_cleanup_tab():
         
         with col1:
             if st.button("Clear Cache"):
-                # Clear any cached data
+                # Clear the Streamlit-side fetch caches and the cleaner's own
                 if ytmusic_instance:
-                    cleaner = PlaylistCleaner(ytmusic=ytmusic_instance)
+                    cleaner = _get_playlist_cleaner(ytmusic_instance, id(ytmusic_instance))
                     cleaner.clear_cache()
+                _get_playlist_cleaner.clear()
+                _fetch_liked.clear()
+                _fetch_library.clear()
+                _fetch_playlist_tracks.clear()
                 st.success("Cache cleared - next cleanup will refresh all data")
         
         with col2:
@@ -2307,11 +2898,16 @@ def render_playlist_cleanup_tab():
                 help="Save similarity matches and duplicates for manual review in a separate interface"
             )
     
-    # Dry run option (moved outside tabs to apply to all)
-    dry_run = st.checkbox("Dry run (preview only)", value=True, help="Preview changes without actually modifying the playlist")
-    
+    # Dry run + trigger live in a form so toggling it doesn't rerun the
+    # script on its own — one rerun on submit. The tabbed options above
+    # stay outside: their reveal-on-toggle widgets need per-change reruns
+    # and forms cannot contain the Clear Cache button.
+    with st.form('playlist_cleanup_form'):
+        dry_run = st.checkbox("Dry run (preview only)", value=True, help="Preview changes without actually modifying the playlist")
+        run_cleanup = st.form_submit_button("🧽 Clean Playlist", type="primary")
+
     # Execute cleanup
-    if st.button("🧽 Clean Playlist", type="primary"):
+    if run_cleanup:
         if not playlist_url:
             st.error("Please enter a playlist URL")
             return
@@ -2322,8 +2918,8 @@ def render_playlist_cleanup_tab():
         
         with st.spinner("Cleaning playlist..."):
             try:
-                # Create cleaner instance
-                cleaner = PlaylistCleaner(ytmusic=ytmusic_instance)
+                # Reuse the per-client cleaner so its internal caches stay warm
+                cleaner = _get_playlist_cleaner(ytmusic_instance, id(ytmusic_instance))
                 
                 # Show progress
                 progress_bar = st.progress(0)
@@ -2338,7 +2934,7 @@ def render_playlist_cleanup_tab():
                     
                     # Get playlist tracks for preview
                     playlist_id = cleaner.extract_playlist_id(playlist_url)
-                    tracks = cleaner.get_playlist_tracks_robust(playlist_id)
+                    tracks = _fetch_playlist_tracks(cleaner, id(ytmusic_instance), playlist_id)
                     
                     if not tracks:
                         st.error("Could not retrieve playlist tracks. Check the URL and try again.")
@@ -2366,9 +2962,10 @@ def render_playlist_cleanup_tab():
                                 st.metric("Need Review", len(similarity_matches['needs_review']))
                             
                             # Show similarity match details
-                            if similarity_matches['high_confidence']:
-                                with st.expander(f"✅ High Confidence Library Duplicates ({len(similarity_matches['high_confidence'])})"):
-                                    for match in similarity_matches['high_confidence'][:10]:
+                            n_high = len(similarity_matches['high_confidence'])
+                            if n_high:
+                                with st.expander(f"✅ High Confidence Library Duplicates ({n_high})"):
+                                    for match in islice(similarity_matches['high_confidence'], 10):
                                         track = match['playlist_track']
                                         cimg, cinfo = st.columns([1, 6])
                                         with cimg:
@@ -2378,12 +2975,13 @@ def render_playlist_cleanup_tab():
                                             explicit_flag = " (Explicit)" if getattr(track, 'is_explicit', False) else ""
                                             st.write(f"• **{track.title}**{explicit_flag} (confidence: {match['confidence']:.1%})")
                                             st.caption(', '.join(track.artists))
-                                    if len(similarity_matches['high_confidence']) > 10:
-                                        st.write(f"... and {len(similarity_matches['high_confidence']) - 10} more")
-                            
-                            if similarity_matches['needs_review']:
-                                with st.expander(f"⚠️ Needs Manual Review ({len(similarity_matches['needs_review'])})"):
-                                    for match in similarity_matches['needs_review'][:10]:
+                                    if n_high > 10:
+                                        st.write(f"... and {n_high - 10} more")
+
+                            n_review = len(similarity_matches['needs_review'])
+                            if n_review:
+                                with st.expander(f"⚠️ Needs Manual Review ({n_review})"):
+                                    for match in islice(similarity_matches['needs_review'], 10):
                                         track = match['playlist_track']
                                         cimg, cinfo = st.columns([1, 6])
                                         with cimg:
@@ -2393,16 +2991,18 @@ def render_playlist_cleanup_tab():
                                             explicit_flag = " (Explicit)" if getattr(track, 'is_explicit', False) else ""
                                             st.write(f"• **{track.title}**{explicit_flag} (confidence: {match['confidence']:.1%})")
                                             st.caption(', '.join(track.artists))
-                                    if len(similarity_matches['needs_review']) > 10:
-                                        st.write(f"... and {len(similarity_matches['needs_review']) - 10} more")
+                                    if n_review > 10:
+                                        st.write(f"... and {n_review - 10} more")
                         
                         if dedupe_internal:
                             status_text.text("Analyzing internal playlist duplicates...")
                             progress_bar.progress(0.7)
                             
                             internal_duplicates = cleaner.find_playlist_internal_duplicates(tracks)
-                            auto_remove_candidates = [dup for dup in internal_duplicates if not dup.review_needed]
-                            needs_review_internal = [dup for dup in internal_duplicates if dup.review_needed]
+                            # One pass splits the groups instead of filtering twice
+                            auto_remove_candidates, needs_review_internal = [], []
+                            for dup in internal_duplicates:
+                                (needs_review_internal if dup.review_needed else auto_remove_candidates).append(dup)
                             
                             col1, col2, col3, col4 = st.columns(4)
                             with col1:
@@ -2415,19 +3015,21 @@ def render_playlist_cleanup_tab():
                                 st.metric("Review Needed", len(needs_review_internal))
                             
                             # Show internal duplicate details
-                            if auto_remove_candidates:
-                                with st.expander(f"✅ Auto-Remove Internal Duplicates ({len(auto_remove_candidates)} groups)"):
-                                    for dup in auto_remove_candidates[:10]:
+                            n_auto = len(auto_remove_candidates)
+                            if n_auto:
+                                with st.expander(f"✅ Auto-Remove Internal Duplicates ({n_auto} groups)"):
+                                    for dup in islice(auto_remove_candidates, 10):
                                         st.write(f"• **{dup.signature}** ({dup.duplicate_count} copies, confidence: {dup.confidence:.1%})")
-                                    if len(auto_remove_candidates) > 10:
-                                        st.write(f"... and {len(auto_remove_candidates) - 10} more groups")
-                            
-                            if needs_review_internal:
-                                with st.expander(f"⚠️ Internal Duplicates Need Review ({len(needs_review_internal)} groups)"):
-                                    for dup in needs_review_internal[:10]:
+                                    if n_auto > 10:
+                                        st.write(f"... and {n_auto - 10} more groups")
+
+                            n_internal = len(needs_review_internal)
+                            if n_internal:
+                                with st.expander(f"⚠️ Internal Duplicates Need Review ({n_internal} groups)"):
+                                    for dup in islice(needs_review_internal, 10):
                                         st.write(f"• **{dup.signature}** ({dup.duplicate_count} copies, confidence: {dup.confidence:.1%})")
-                                    if len(needs_review_internal) > 10:
-                                        st.write(f"... and {len(needs_review_internal) - 10} more groups")
+                                    if n_internal > 10:
+                                        st.write(f"... and {n_internal - 10} more groups")
                     
                     else:
                         # Basic preview
@@ -2437,25 +3039,40 @@ def render_playlist_cleanup_tab():
                         # Get comparison data
                         liked_songs = set()
                         library_video_ids = set()
-                        
-                        if remove_liked:
-                            liked_songs = cleaner.get_liked_songs_cached()
-                        
-                        if dedupe_library:
-                            library_songs = cleaner.get_library_songs_cached()
-                            library_video_ids = {song.get('videoId') for song in library_songs if song.get('videoId')}
+
+                        if remove_liked and dedupe_library:
+                            # Independent network fetches — run them concurrently so
+                            # the wall time is the slower of the two, not their sum
+                            user_key = _cleanup_user_key(ytmusic_instance)
+                            with ThreadPoolExecutor(max_workers=2) as executor:
+                                liked_future = executor.submit(_fetch_liked, cleaner, user_key)
+                                library_future = executor.submit(_fetch_library, cleaner, user_key)
+                                liked_songs = frozenset(liked_future.result())
+                                library_songs = library_future.result()
+                            # Single .get per track; the - {None} drops missing ids.
+                            # frozenset: these are lookup-only from here on.
+                            library_video_ids = frozenset(
+                                song.get('videoId') for song in library_songs
+                            ) - {None}
+                        elif remove_liked:
+                            liked_songs = frozenset(_fetch_liked(cleaner, _cleanup_user_key(ytmusic_instance)))
+                        elif dedupe_library:
+                            library_songs = _fetch_library(cleaner, _cleanup_user_key(ytmusic_instance))
+                            library_video_ids = frozenset(
+                                song.get('videoId') for song in library_songs
+                            ) - {None}
                         
                         progress_bar.progress(0.9)
                         
-                        # Analyze what would be removed
-                        tracks_to_remove_liked = []
-                        tracks_to_remove_library = []
-                        
-                        for track in tracks:
-                            if remove_liked and track.video_id in liked_songs:
-                                tracks_to_remove_liked.append(track)
-                            elif dedupe_library and track.video_id in library_video_ids:
-                                tracks_to_remove_library.append(track)
+                        # Analyze what would be removed. Set intersection in C
+                        # replaces the per-track membership loop; subtracting
+                        # liked hits keeps the old elif precedence.
+                        vid_to_track = {t.video_id: t for t in tracks if t.video_id}
+                        vids = vid_to_track.keys()
+                        liked_hits = liked_songs & vids
+                        lib_hits = (library_video_ids & vids) - liked_hits
+                        tracks_to_remove_liked = [vid_to_track[v] for v in liked_hits]
+                        tracks_to_remove_library = [vid_to_track[v] for v in lib_hits]
                         
                         # Show basic preview results
                         col1, col2, col3, col4 = st.columns(4)
@@ -2469,9 +3086,10 @@ def render_playlist_cleanup_tab():
                             st.metric("Final Count", len(tracks) - len(tracks_to_remove_liked) - len(tracks_to_remove_library))
                         
                         # Show details
-                        if tracks_to_remove_liked:
-                            with st.expander(f"🎵 Liked Songs to Remove ({len(tracks_to_remove_liked)})"):
-                                for track in tracks_to_remove_liked[:20]:
+                        n_liked = len(tracks_to_remove_liked)
+                        if n_liked:
+                            with st.expander(f"🎵 Liked Songs to Remove ({n_liked})"):
+                                for track in islice(tracks_to_remove_liked, 20):
                                     cimg, cinfo = st.columns([1, 6])
                                     with cimg:
                                         if getattr(track, 'thumbnail', None):
@@ -2480,12 +3098,13 @@ def render_playlist_cleanup_tab():
                                         explicit_flag = " (Explicit)" if getattr(track, 'is_explicit', False) else ""
                                         st.write(f"• {track.title}{explicit_flag}")
                                         st.caption(', '.join(track.artists))
-                                if len(tracks_to_remove_liked) > 20:
-                                    st.write(f"... and {len(tracks_to_remove_liked) - 20} more")
-                        
-                        if tracks_to_remove_library:
-                            with st.expander(f"📚 Library Duplicates to Remove ({len(tracks_to_remove_library)})"):
-                                for track in tracks_to_remove_library[:20]:
+                                if n_liked > 20:
+                                    st.write(f"... and {n_liked - 20} more")
+
+                        n_lib = len(tracks_to_remove_library)
+                        if n_lib:
+                            with st.expander(f"📚 Library Duplicates to Remove ({n_lib})"):
+                                for track in islice(tracks_to_remove_library, 20):
                                     cimg, cinfo = st.columns([1, 6])
                                     with cimg:
                                         if getattr(track, 'thumbnail', None):
@@ -2494,8 +3113,8 @@ def render_playlist_cleanup_tab():
                                         explicit_flag = " (Explicit)" if getattr(track, 'is_explicit', False) else ""
                                         st.write(f"• {track.title}{explicit_flag}")
                                         st.caption(', '.join(track.artists))
-                                if len(tracks_to_remove_library) > 20:
-                                    st.write(f"... and {len(tracks_to_remove_library) - 20} more")
+                                if n_lib > 20:
+                                    st.write(f"... and {n_lib - 20} more")
                     
                     progress_bar.progress(1.0)
                     status_text.text("Preview complete!")
@@ -2540,32 +3159,18 @@ def render_playlist_cleanup_tab():
                             st.info(f"💡 {len(result['similarity_matches']['needs_review'])} matches need manual review - use the review interface below")
                         
                         if save_review_data and result['similarity_matches']['needs_review']:
-                            # Save review data
-                            review_data = {
+                            # Keep the raw matches; the review interface
+                            # serializes only the slice it shows and the
+                            # full export happens on demand.
+                            st.session_state['playlist_review_data'] = {
                                 'summary': {
                                     'total_matches': result['similarity_matches']['total_matches'],
                                     'needs_review': len(result['similarity_matches']['needs_review']),
                                     'generated_at': time.strftime('%Y-%m-%d %H:%M:%S')
                                 },
-                                'needs_review': [{
-                                    'playlist_track': {
-                                        'videoId': match['playlist_track'].video_id,
-                                        'setVideoId': match['playlist_track'].set_video_id,
-                                        'title': match['playlist_track'].title,
-                                        'artists': match['playlist_track'].artists,
-                                        'duration': match['playlist_track'].duration
-                                    },
-                                    'confidence': match['confidence'],
-                                    'library_matches': [{
-                                        'title': lib_match['library_track'].get('title'),
-                                        'artists': [a.get('name') for a in lib_match['library_track'].get('artists', [])],
-                                        'similarity': lib_match['similarity'],
-                                        'reason': lib_match['reason']
-                                    } for lib_match in match['library_matches']]
-                                } for match in result['similarity_matches']['needs_review']]
+                                'needs_review_raw': result['similarity_matches']['needs_review'],
                             }
-                            
-                            st.session_state['playlist_review_data'] = review_data
+                            st.session_state.pop('playlist_review_export', None)
                             st.success("📋 Review data saved for manual processing")
                     
                     elif dedupe_internal:
@@ -2650,56 +3255,22 @@ def render_playlist_cleanup_tab():
             
             st.markdown("**📚 Library Duplicate Candidates for Manual Review**")
             
-            with st.expander(f"Review {len(review_data['needs_review'])} potential library duplicates", expanded=True):
-                if st.button("🗑️ Clear Library Review Data"):
-                    del st.session_state['playlist_review_data']
-                    st.rerun()
-                
-                for i, item in enumerate(review_data['needs_review'][:10]):  # Show first 10
-                    track = item['playlist_track']
-                    
-                    st.markdown(f"**{i+1}. {track['title']}** by {', '.join(track['artists'])}")
-                    st.write(f"Confidence: {item['confidence']:.1%}")
-                    
-                    for match in item['library_matches']:
-                        st.write(f"  → Similar to: **{match['title']}** by {', '.join(match['artists'])} ({match['reason']})")
-                    
-                    if st.button(f"Remove Track {i+1}", key=f"remove_lib_{i}"):
-                        st.info(f"Would remove: {track['title']} (feature coming soon)")
-                    
-                    st.markdown("---")
-                
-                if len(review_data['needs_review']) > 10:
-                    st.info(f"Showing first 10 of {len(review_data['needs_review'])} tracks needing review")
+            _render_library_review_section(review_data)
         
         if 'internal_dedup_data' in st.session_state:
             dedup_data = st.session_state['internal_dedup_data']
             
             st.markdown("**🔄 Internal Duplicate Groups for Manual Review**")
             
-            needs_review_duplicates = [d for d in dedup_data['duplicates'] if d['review_needed']]
+            # Filter once per dataset, not on every rerun: the result is
+            # memoized on the session-state dict itself.
+            needs_review_duplicates = dedup_data.get('_needs_review')
+            if needs_review_duplicates is None:
+                needs_review_duplicates = [d for d in dedup_data['duplicates'] if d['review_needed']]
+                dedup_data['_needs_review'] = needs_review_duplicates
             
             if needs_review_duplicates:
-                with st.expander(f"Review {len(needs_review_duplicates)} duplicate groups", expanded=True):
-                    if st.button("🗑️ Clear Internal Dedup Data"):
-                        del st.session_state['internal_dedup_data']
-                        st.rerun()
-                    
-                    for i, dup in enumerate(needs_review_duplicates[:5]):  # Show first 5 groups
-                        st.markdown(f"**Group {i+1}: {dup['signature']}** ({dup['duplicate_count']} copies, confidence: {dup['confidence']:.1%})")
-                        
-                        st.write("Tracks in this group:")
-                        for j, track in enumerate(dup['tracks_to_keep'] + dup['tracks_to_remove']):
-                            marker = "✅ Keep" if j == 0 else "❌ Remove"
-                            st.write(f"  {marker} **{track['title']}** by {', '.join(track['artists'])}")
-                        
-                        if st.button(f"Apply Group {i+1} Removals", key=f"remove_group_{i}"):
-                            st.info(f"Would remove {len(dup['tracks_to_remove'])} tracks from this group (feature coming soon)")
-                        
-                        st.markdown("---")
-                    
-                    if len(needs_review_duplicates) > 5:
-                        st.info(f"Showing first 5 of {len(needs_review_duplicates)} groups needing review")
+                _render_internal_dedup_section(needs_review_duplicates)
 
 
 def render_help_tab():
@@ -122,7 +122,7 @@ def audit_playlist(
     Returns dict with keys 'present', 'review', 'missing' containing row dicts.
     """
     # Build indices
-    exact_idx, base_idx = _build_indices(library.music_tracks)
+    exact_idx, base_idx, token_idx = _build_indices(library.music_tracks)
     present_rows: List[Dict[str, Any]] = []
     review_rows: List[Dict[str, Any]] = []
     missing_rows: List[Dict[str, Any]] = []
@@ -130,7 +130,7 @@ def audit_playlist(
     matcher = LibraryComparator(strict_mode=False, enable_duration=enable_duration, enable_album=enable_album).matcher
 
     for it in items:
-        bucket, best, score = _match_item(it, library.music_tracks, exact_idx, base_idx, matcher, present_threshold, review_threshold)
+        bucket, best, score = _match_item(it, library.music_tracks, exact_idx, base_idx, token_idx, matcher, present_threshold, review_threshold)
         row = {
             "playlist_title": it.title,
             "playlist_artist": it.artist,
@@ -156,12 +156,18 @@ def audit_playlist(
 def _build_indices(tracks: List[Track]):
     exact = {}
     base = {}
+    token = {}
     for t in tracks:
         key = (t.normalized_title, t.normalized_artist)
         exact.setdefault(key, []).append(t)
         base_title = _strip_version_tokens(t.normalized_title)
         base.setdefault((base_title, t.normalized_artist), []).append(t)
-    return exact, base
+        # Inverted artist-token index so the fuzzy fallback looks up
+        # candidates instead of scanning the whole library per item.
+        if t.is_music and t.artist_tokens:
+            for tok in t.artist_tokens:
+                token.setdefault(tok, []).append(t)
+    return exact, base, token
 
 
 def _strip_version_tokens(title: str) -> str:
@@ -197,6 +203,7 @@ def _match_item(
     lib_tracks: List[Track],
     exact_idx,
     base_idx,
+    token_idx,
     matcher,
     present_threshold: float,
     review_threshold: float,
@@ -224,15 +231,17 @@ def _match_item(
         if best and best_score >= review_threshold:
             return "review", best, best_score
 
-    # 3) Fuzzy across all (prefilter by artist token overlap)
+    # 3) Fuzzy across candidates sharing an artist token (O(1) index lookups
+    #    rather than a full-library scan per item)
     src_tokens = source.artist_tokens or set()
-    cands = []
     if src_tokens:
-        for t in lib_tracks:
-            if not t.is_music or not t.artist_tokens:
-                continue
-            if src_tokens.intersection(t.artist_tokens):
-                cands.append(t)
+        seen = set()
+        cands = []
+        for tok in src_tokens:
+            for t in token_idx.get(tok, ()):
+                if id(t) not in seen:
+                    seen.add(id(t))
+                    cands.append(t)
     else:
         cands = lib_tracks
 
@@ -0,0 +1,69 @@
+"""
+Unit tests for CLI helpers.
+"""
+
+import pytest
+from musicweb.cli.main import _tracks_from_csv
+
+
+def _write_csv(tmp_path, text, encoding='utf-8'):
+    """Write CSV text to a temp file and return its path."""
+    path = tmp_path / "tracks.csv"
+    path.write_text(text, encoding=encoding)
+    return str(path)
+
+
+class TestTracksFromCsv:
+    """Test the missing-tracks CSV loader."""
+
+    def test_full_rows(self, tmp_path):
+        """All columns present map straight onto Track fields."""
+        path = _write_csv(
+            tmp_path,
+            "title,artist,album,duration\n"
+            "Hey Jude,The Beatles,Past Masters,210\n"
+        )
+        tracks = _tracks_from_csv(path)
+
+        assert len(tracks) == 1
+        assert tracks[0].title == "Hey Jude"
+        assert tracks[0].artist == "The Beatles"
+        assert tracks[0].album == "Past Masters"
+        assert tracks[0].duration == 210
+
+    def test_missing_columns(self, tmp_path):
+        """Absent columns become empty strings or None, not KeyErrors."""
+        path = _write_csv(tmp_path, "title\nHey Jude\n")
+        tracks = _tracks_from_csv(path)
+
+        assert len(tracks) == 1
+        assert tracks[0].title == "Hey Jude"
+        assert tracks[0].artist == ""
+        assert tracks[0].album is None
+        assert tracks[0].duration is None
+
+    def test_bom_header(self, tmp_path):
+        """A UTF-8 BOM must not corrupt the first header name."""
+        path = _write_csv(
+            tmp_path,
+            "title,artist\nHey Jude,The Beatles\n",
+            encoding='utf-8-sig',
+        )
+        tracks = _tracks_from_csv(path)
+
+        assert tracks[0].title == "Hey Jude"
+        assert tracks[0].artist == "The Beatles"
+
+    def test_duration_parsing(self, tmp_path):
+        """Integers and floats parse; blank or junk becomes None."""
+        path = _write_csv(
+            tmp_path,
+            "title,duration\n"
+            "A,210\n"
+            "B,210.7\n"
+            "C,\n"
+            "D,invalid\n"
+        )
+        tracks = _tracks_from_csv(path)
+
+        assert [t.duration for t in tracks] == [210, 210, None, None]
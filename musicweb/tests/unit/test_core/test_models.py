@@ -3,7 +3,7 @@ Unit tests for core models.
 """
 
 import pytest
-from musicweb.core.models import Track, Library, TrackNormalizer
+from musicweb.core.models import Track, Library, TrackMatcher, TrackNormalizer
 
 
 class TestTrack:
@@ -104,6 +104,51 @@ class TestLibrary:
         assert artist_counts["Artist A"] >= 1
 
 
+class TestTrackMatcherSimilarity:
+    """Regression tests for TrackMatcher._cached_string_similarity."""
+
+    def test_empty_strings_score_zero(self):
+        """Empty input never matches anything."""
+        matcher = TrackMatcher()
+        assert matcher._cached_string_similarity("", "Artist") == 0.0
+        assert matcher._cached_string_similarity("Artist", "") == 0.0
+
+    def test_equal_after_normalization(self):
+        """Case and surrounding whitespace are ignored."""
+        matcher = TrackMatcher()
+        assert matcher._cached_string_similarity("  The Beatles ", "the beatles") == 1.0
+
+    def test_result_is_cached_symmetrically(self):
+        """The cache key is order-independent, so (a, b) and (b, a) agree."""
+        matcher = TrackMatcher()
+        first = matcher._cached_string_similarity("Daft Punk", "Daft Punks")
+        assert ("daft punk", "daft punks") in matcher._similarity_cache
+        assert matcher._cached_string_similarity("Daft Punks", "Daft Punk") == first
+
+    def test_jaro_winkler_scores_typos_high(self):
+        """Single-character typos in short names stay above 0.9."""
+        pytest.importorskip("rapidfuzz")
+        matcher = TrackMatcher()
+        assert matcher._cached_string_similarity("Metallica", "Metalica") > 0.9
+        assert matcher._cached_string_similarity("abc", "xyz") == 0.0
+
+    def test_jaro_winkler_prefix_weighting(self):
+        """Shared prefixes are boosted: an edit at the end of the string
+        must outscore the same edit at the start."""
+        pytest.importorskip("rapidfuzz")
+        matcher = TrackMatcher()
+        end_edit = matcher._cached_string_similarity("abcdef", "abcdez")
+        start_edit = matcher._cached_string_similarity("abcdef", "zbcdef")
+        assert end_edit > start_edit
+
+    def test_fallback_without_rapidfuzz(self, monkeypatch):
+        """Without rapidfuzz only exact normalized matches score."""
+        monkeypatch.setattr("musicweb.core.models.HAVE_RAPIDFUZZ", False)
+        matcher = TrackMatcher()
+        assert matcher._cached_string_similarity("Artist A", "Artist B") == 0.0
+        assert matcher._cached_string_similarity("Artist A", "artist a") == 1.0
+
+
 class TestTrackNormalizer:
     """Test TrackNormalizer utility functions."""
     
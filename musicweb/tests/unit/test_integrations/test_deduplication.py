@@ -0,0 +1,85 @@
+"""
+Unit tests for the YouTube Music deduplicator.
+"""
+
+import pytest
+from musicweb.integrations.deduplication import YouTubeMusicDeduplicator
+
+
+def _song(video_id, title, artist, album="Greatest Hits Album", duration=200):
+    """Build a minimal library-song dict in the ytmusicapi shape."""
+    return {
+        "videoId": video_id,
+        "title": title,
+        "artists": [{"name": artist}],
+        "album": {"name": album},
+        "duration": "3:20",
+        "duration_seconds": duration,
+        "isExplicit": False,
+    }
+
+
+def _detector_with(songs):
+    dedup = YouTubeMusicDeduplicator()
+    dedup.library_songs = songs
+    return dedup
+
+
+class TestFindDuplicates:
+    """Test duplicate grouping over a small in-memory fixture."""
+
+    def test_empty_library(self):
+        """No songs means no groups, not an error."""
+        assert _detector_with([]).find_duplicates() == []
+
+    def test_groups_identical_title_and_artist(self):
+        """Two copies of the same song group; a different title does not."""
+        dedup = _detector_with([
+            _song("v1", "Hey Jude", "The Beatles"),
+            _song("v2", "Hey Jude", "The Beatles"),
+            _song("v3", "Yesterday", "The Beatles"),
+        ])
+        groups = dedup.find_duplicates()
+
+        assert len(groups) == 1
+        assert {d.id for d in groups[0]["duplicates"]} == {"v1", "v2"}
+        assert groups[0]["title"] == "Hey Jude"
+        assert groups[0]["artist"] == "The Beatles"
+
+    def test_same_title_different_artist_not_grouped(self):
+        """A cover sharing the title but no artist stays separate."""
+        dedup = _detector_with([
+            _song("v1", "Hey Jude", "The Beatles"),
+            _song("v2", "Hey Jude", "The Beatles"),
+            _song("v4", "Hey Jude", "Oasis"),
+        ])
+        groups = dedup.find_duplicates()
+
+        assert len(groups) == 1
+        assert "v4" not in {d.id for d in groups[0]["duplicates"]}
+
+    def test_same_video_id_groups_regardless_of_title(self):
+        """The same upload listed twice is a certain duplicate."""
+        dedup = _detector_with([
+            _song("v10", "Wonderwall", "Oasis"),
+            _song("v10", "Wonderwall (Alt)", "Oasis"),
+        ])
+        groups = dedup.find_duplicates()
+
+        assert len(groups) == 1
+        assert len(groups[0]["duplicates"]) == 2
+
+    def test_group_shape(self):
+        """Groups carry a similarity-score dict and quality-ranked entries."""
+        dedup = _detector_with([
+            _song("v1", "Hey Jude", "The Beatles"),
+            _song("v2", "Hey Jude", "The Beatles"),
+        ])
+        group = dedup.find_duplicates()[0]
+
+        scores = group["similarity_scores"]
+        assert set(scores) == {"title_similarity", "artist_similarity"}
+        assert all(0.0 <= v <= 1.0 for v in scores.values())
+
+        ranks = [d.quality_score for d in group["duplicates"]]
+        assert ranks == sorted(ranks, reverse=True)